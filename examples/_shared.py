@@ -0,0 +1,62 @@
+"""
+Shared LLM clients and async helpers for the example scripts
+"""
+import asyncio
+import functools
+import hashlib
+
+# LLM clients keyed by (provider, model, api key hash)
+_LLM_CLIENTS = {}
+
+# In-flight probe requests, so concurrent identical probes share one call
+_INFLIGHT_PROBES = {}
+
+@functools.lru_cache(maxsize=1)
+def get_qwen():
+    """Return the shared QwenClient, creating it on first use"""
+    from src.api.qwen_client import QwenClient
+    return QwenClient()
+
+def get_llm_client(config):
+    """Return the shared LLMFactory client for this provider, model and key"""
+    from src.api.llm_provider import LLMFactory
+    
+    api_key_hash = hashlib.sha256((config.api_key or "").encode()).hexdigest()
+    key = (config.provider, config.model, api_key_hash)
+    
+    client = _LLM_CLIENTS.get(key)
+    if client is None:
+        client = _LLM_CLIENTS[key] = LLMFactory.create_client(config)
+    return client
+
+async def _coalesce(key, make_call):
+    """Await the in-flight call for key, or start it if none is running"""
+    future = _INFLIGHT_PROBES.get(key)
+    if future is None:
+        future = _INFLIGHT_PROBES[key] = asyncio.ensure_future(make_call())
+        future.add_done_callback(lambda _: _INFLIGHT_PROBES.pop(key, None))
+    return await asyncio.shield(future)
+
+async def probe_llm(client, prompt, max_tokens=10):
+    """Send a readiness prompt, sharing the request with identical concurrent probes"""
+    return await _coalesce(
+        (id(client), prompt, max_tokens),
+        lambda: client.generate(prompt, max_tokens=max_tokens)
+    )
+
+async def probe_health(client):
+    """Run client.check_health(), sharing the request with concurrent callers"""
+    return await _coalesce((id(client), "check_health"), client.check_health)
+
+async def run_batch(pairs, max_concurrency=8):
+    """Execute (agent, task) pairs concurrently, at most max_concurrency at once"""
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def _one(agent, task):
+        async with semaphore:
+            return await agent.execute(task)
+    
+    return await asyncio.gather(
+        *(_one(agent, task) for agent, task in pairs),
+        return_exceptions=True
+    )
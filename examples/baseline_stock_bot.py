@@ -3,36 +3,106 @@
 BASELINE Stock Bot WITHOUT Self-Healing - For Comparison
 """
 import asyncio
-import random
+import os
 import time
+import numpy as np
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Per-symbol output; set VERBOSE=0 to skip it during benchmark runs
+VERBOSE = os.getenv("VERBOSE", "1") != "0"
+
+def tally(outcomes):
+    """Count (successes, failures) in a list of booleans in one pass"""
+    successes = sum(outcomes)
+    return successes, len(outcomes) - successes
+
 class BaselineStockAgent:
     """Baseline stock agent without self-healing"""
     
-    def __init__(self, agent_id="baseline_stock_bot"):
+    # Circuit breaker: open after this many consecutive failures, probe again after cooldown
+    FAILURE_THRESHOLD = 3
+    COOLDOWN_SECONDS = 5.0
+    
+    def __init__(self, agent_id="baseline_stock_bot", seed=None):
         self.agent_id = agent_id
+        self._rng = np.random.default_rng(seed)
         self.status = "healthy"
         self.error_count = 0
         self.success_count = 0
         
-    async def process(self, symbol):
-        """Check stock price with 30% failure rate"""
+        # closed -> open -> half_open (single probe) -> closed/open
+        self._state = "closed"
+        self._opened_at = 0.0
+        self._consecutive_failures = 0
+    
+    def draw_outcomes(self, n):
+        """Pre-draw n failure flags (30% failure rate, same as healing version) and prices"""
+        fails = self._rng.random(n) < 0.3
+        prices = self._rng.integers(100, 201, n)
+        return fails, prices
+    
+    def _allow_request(self):
+        """Return True if the circuit lets this call through"""
+        if self._state == "closed":
+            return True
+        if self._state == "open" and time.monotonic() - self._opened_at >= self.COOLDOWN_SECONDS:
+            self._state = "half_open"
+            return True
+        return False
+    
+    def _record_success(self):
+        self.success_count += 1
+        self._consecutive_failures = 0
+        self._state = "closed"
+    
+    def _record_failure(self):
+        self.error_count += 1
+        self._consecutive_failures += 1
+        if self._state == "half_open" or self._consecutive_failures >= self.FAILURE_THRESHOLD:
+            self._state = "open"
+            self._opened_at = time.monotonic()
+    
+    async def process(self, symbol, fail, price):
+        """Check stock price using a pre-drawn failure flag and price"""
+        if not self._allow_request():
+            raise Exception(f"Circuit open, skipped {symbol}")
+        
         print(f"📈 [BASELINE] Checking {symbol}...")
         
         await asyncio.sleep(0.3)
         
-        # 30% chance of failure (same as healing version)
-        if random.random() < 0.3:
-            self.error_count += 1
+        if fail:
+            self._record_failure()
             raise Exception(f"API Connection Failed for {symbol}")
         
-        self.success_count += 1
-        return random.randint(100, 200)
+        self._record_success()
+        return price
+    
+    async def process_batch(self, symbols, fails, prices):
+        """Check a batch of stock prices in a single simulated round-trip"""
+        if not self._allow_request():
+            return [(symbol, Exception(f"Circuit open, skipped {symbol}")) for symbol in symbols]
+        
+        if VERBOSE:
+            print("\n".join(f"📈 [BASELINE] Checking {symbol}..." for symbol in symbols))
+        
+        await asyncio.sleep(0.3)
+        
+        # The round-trip has been paid, so every outcome in it counts; the
+        # breaker only gates the next batch
+        results = []
+        for symbol, fail, price in zip(symbols, fails, prices):
+            if fail:
+                self._record_failure()
+                results.append((symbol, Exception(f"API Connection Failed for {symbol}")))
+            else:
+                self._record_success()
+                results.append((symbol, int(price)))
+        return results
 
-async def main():
+async def main(seed=None):
     """Run comparison experiment"""
     print("="*70)
     print("📊 BASELINE SYSTEM EXPERIMENT (No Self-Healing)")
@@ -40,30 +110,36 @@ async def main():
     
     stock_symbols = ["AAPL", "GOOGL", "TSLA", "MSFT", "AMZN", "NFLX", "NVDA", "META"]
     
-    # Baseline system
-    baseline_agent = BaselineStockAgent("baseline_bot")
+    # Baseline system, with its own RNG so seeded runs are reproducible
+    baseline_agent = BaselineStockAgent("baseline_bot", seed=seed)
+    fails, stock_prices = baseline_agent.draw_outcomes(len(stock_symbols))
     baseline_results = []
     
     print(f"\n📋 Processing {len(stock_symbols)} stocks with BASELINE system...")
     
-    for i, symbol in enumerate(stock_symbols):
-        print(f"\n--- Job {i+1}: {symbol} ---------")
+    # Symbols are independent, so fetch them in one batched round-trip
+    results = await baseline_agent.process_batch(stock_symbols, fails, stock_prices)
+    
+    out = []
+    for i, (symbol, price) in enumerate(results):
+        out.append(f"\n--- Job {i+1}: {symbol} ---------")
         
-        try:
-            price = await baseline_agent.process(symbol)
-            baseline_results.append(True)
-            print(f"  ✅ Price: ${price}")
-        except Exception as e:
+        if isinstance(price, Exception):
             baseline_results.append(False)
-            print(f"  ❌ Failed: {str(e)[:40]}")
-            
-            # NO HEALING - just continue with errors
-            if baseline_agent.error_count >= 3:
-                print(f"  ⚠️  Agent has {baseline_agent.error_count} errors (No healing available)")
+            out.append(f"  ❌ Failed: {str(price)[:40]}")
+        else:
+            baseline_results.append(True)
+            out.append(f"  ✅ Price: ${price}")
+    
+    if VERBOSE:
+        print("\n".join(out))
+    
+    # NO HEALING - just continue with errors
+    if baseline_agent.error_count >= 3:
+        print(f"\n  ⚠️  Agent has {baseline_agent.error_count} errors (No healing available)")
     
     # Calculate metrics
-    baseline_success = baseline_results.count(True)
-    baseline_failure = baseline_results.count(False)
+    baseline_success, baseline_failure = tally(baseline_results)
     baseline_success_rate = baseline_success / len(baseline_results) if baseline_results else 0
     
     print("\n" + "="*70)
@@ -3,45 +3,51 @@
 COMPLETE TEST SUITE - All Scenarios
 """
 import asyncio
-import os
 import sys
+import importlib
 import importlib.util
-from dotenv import load_dotenv
+from pathlib import Path
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-load_dotenv()
+ROOT = str(Path(__file__).resolve().parents[1])
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
 
-async def run_scenario(scenario_name, script_path):
+from src.utils.config import get_settings
+
+get_settings()
+
+# Known scenario entry functions, in lookup order
+ENTRY_NAMES = (
+    'main',
+    'run_comparison',
+    'scenario_c_demo',
+    'scenario_d_demo',
+    'simple_demo',
+    'demo_custom_agents',
+    'complete_working_test',
+)
+
+async def run_scenario(scenario_name, module_name):
     """Run a single scenario"""
     print(f"\n{'='*60}")
     print(f"🚀 RUNNING: {scenario_name}")
     print(f"{'='*60}")
     
     try:
-        # Dynamically import and run the script
-        spec = importlib.util.spec_from_file_location(scenario_name, script_path)
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
+        # Import through the normal machinery (sys.modules and __pycache__ reuse)
+        module = importlib.import_module(module_name)
         
         # Try different function names
-        if hasattr(module, 'main'):
-            await module.main()
-        elif hasattr(module, 'run_comparison'):
-            await module.run_comparison()
-        elif hasattr(module, 'scenario_c_demo'):
-            await module.scenario_c_demo()
-        elif hasattr(module, 'scenario_d_demo'):
-            await module.scenario_d_demo()
-        elif hasattr(module, 'simple_demo'):
-            await module.simple_demo()
-        elif hasattr(module, 'demo_custom_agents'):
-            await module.demo_custom_agents()
-        elif hasattr(module, 'complete_working_test'):
-            await module.complete_working_test()
-        else:
-            print(f"❌ No known entry function found in {script_path}")
+        entry = next(
+            (fn for name in ENTRY_NAMES if (fn := getattr(module, name, None)) is not None),
+            None
+        )
+        if entry is None:
+            print(f"❌ No known entry function found in {module_name}")
             return (scenario_name, False, "No known entry function")
         
+        await entry()
+        
         return (scenario_name, True, "Success")
         
     except Exception as e:
@@ -58,21 +64,32 @@ async def run_all_scenarios():
     print("="*80)
     
     scenarios = [
-        ("TASK 1: Baseline Comparison", "examples/baseline_stock_bot.py"),
-        ("TASK 2: LLM Comparison", "examples/llm_comparison.py"),
-        ("TASK 3: Bug Detection & Code Regeneration", "examples/scenario_c_bug_fixing.py"),
-        ("TASK 4: Security Attack Detection", "examples/scenario_d_security.py")
+        ("TASK 1: Baseline Comparison", "examples.baseline_stock_bot"),
+        ("TASK 2: LLM Comparison", "examples.llm_comparison"),
+        ("TASK 3: Bug Detection & Code Regeneration", "examples.scenario_c_bug_fixing"),
+        ("TASK 4: Security Attack Detection", "examples.scenario_d_security")
     ]
     
-    results = []
+    results = [None] * len(scenarios)
+    pending = []
     
-    for scenario_name, script_path in scenarios:
-        if os.path.exists(script_path):
-            result = await run_scenario(scenario_name, script_path)
-            results.append(result)
+    for index, (scenario_name, module_name) in enumerate(scenarios):
+        if importlib.util.find_spec(module_name) is not None:
+            pending.append(index)
         else:
-            print(f"❌ Script not found: {script_path}")
-            results.append((scenario_name, False, f"Script not found: {script_path}"))
+            print(f"❌ Module not found: {module_name}")
+            results[index] = (scenario_name, False, f"Module not found: {module_name}")
+    
+    # Scenarios are independent, so run them concurrently
+    outcomes = await asyncio.gather(
+        *(run_scenario(*scenarios[index]) for index in pending),
+        return_exceptions=True
+    )
+    
+    for index, outcome in zip(pending, outcomes):
+        if isinstance(outcome, BaseException):
+            outcome = (scenarios[index][0], False, str(outcome))
+        results[index] = outcome
     
     # Summary
     print(f"\n{'='*80}")
@@ -1,11 +1,15 @@
 
 import asyncio
-import os
 import sys
-from dotenv import load_dotenv
+from pathlib import Path
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-load_dotenv()
+ROOT = str(Path(__file__).resolve().parents[1])
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from src.utils.config import get_settings
+
+get_settings()
 
 
 
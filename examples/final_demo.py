@@ -1,13 +1,22 @@
 
 import asyncio
-import os
 import sys
-from dotenv import load_dotenv
+from pathlib import Path
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-load_dotenv()
+ROOT = str(Path(__file__).resolve().parents[1])
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
 
+from src.utils.config import get_settings
 
+get_settings()
+
+# Smoke-test task for each agent type
+TASKS_BY_TYPE = {
+    "data_processor": {"test": "data"},
+    "api_gateway": {"endpoint": "/test"},
+    "analytics": {"report_type": "summary", "metrics": {"test": 100}}
+}
 
 async def final_demo():
     print("="*70)
@@ -15,13 +24,13 @@ async def final_demo():
     print("="*70)
     
     # All imports should work now
-    from src.api.qwen_client import QwenClient
+    from examples._shared import get_qwen, run_batch, probe_llm
     from src.agents.specialized_agents import DataProcessorAgent, APIGatewayAgent, AnalyticsAgent
     from src.agents.healing_agent import HealingAgent
     
     print("\n🔗 Qwen AI Test.....")
-    qwen = QwenClient()
-    print(f"🤖 Qwen: {await qwen.generate('System check - respond OK', max_tokens=5)}")
+    qwen = get_qwen()
+    print(f"🤖 Qwen: {await probe_llm(qwen, 'System check - respond OK', max_tokens=5)}")
     
     print("\n🤖 Creating Agents.....")
     agents = [
@@ -34,16 +43,16 @@ async def final_demo():
     print(f"✅✅✅ Created {len(agents)} agents + 1 healer")
     
     print("\n📊 Testing All Agents.....")
-    for agent in agents:
-        task = {"test": "data"} if agent.agent_type == "data_processor" else \
-               {"endpoint": "/test"} if agent.agent_type == "api_gateway" else \
-               {"report_type": "summary", "metrics": {"test": 100}}
-        
-        try:
-            result = await agent.execute(task)
+    pairs = [
+        (agent, TASKS_BY_TYPE.get(agent.agent_type, TASKS_BY_TYPE["analytics"]))
+        for agent in agents
+    ]
+    
+    for agent, result in zip(agents, await run_batch(pairs)):
+        if isinstance(result, Exception):
+            print(f"  ❌❌ {agent.agent_id}: {str(result)[:50]}")
+        else:
             print(f"  ✅✅ {agent.agent_id}: {result['success']}")
-        except Exception as e:
-            print(f"  ❌❌ {agent.agent_id}: {str(e)[:50]}")
     
     print("\n⚕️  Testing Healing...")
     try:
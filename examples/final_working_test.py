@@ -1,10 +1,15 @@
 import asyncio
 import os
 import sys
-from dotenv import load_dotenv
+from pathlib import Path
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-load_dotenv()
+ROOT = str(Path(__file__).resolve().parents[1])
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from src.utils.config import get_settings
+
+get_settings()
 
 async def final_test():    
     print("="*80)
@@ -107,10 +112,12 @@ async def final_test():
     agents = [agent, buggy_agent, security_agent]
     
     print("📊 Agent Status Report:")
+    out = []
     for a in agents:
         metrics = a.get_metrics()
         status = "🟢" if metrics['status'] == 'healthy' else "🟡" if metrics['status'] == 'degraded' else "🔴"
-        print(f"  {status} {a.agent_id:20} - Status: {metrics['status']:10} Errors: {metrics['error_count']}")
+        out.append(f"  {status} {a.agent_id:20} - Status: {metrics['status']:10} Errors: {metrics['error_count']}")
+    print("\n".join(out))
     
     print("\n" + "="*80)
     print("🎉 FINAL TEST RESULTS")
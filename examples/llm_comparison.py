@@ -6,10 +6,19 @@ import asyncio
 import os
 import sys
 import time
-from dotenv import load_dotenv
+from pathlib import Path
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-load_dotenv()
+ROOT = str(Path(__file__).resolve().parents[1])
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from src.utils.config import get_settings
+
+get_settings()
+
+def _trunc(text, limit=100):
+    """Truncate text to limit characters, marking the cut with an ellipsis"""
+    return text if len(text) <= limit else f"{text[:limit]}..."
 
 async def main():
     """Compare different LLM providers"""
@@ -17,7 +26,8 @@ async def main():
     print("🤖 LLM PROVIDER COMPARISON")
     print("="*70)
     
-    from src.api.llm_provider import LLMConfig, LLMProvider, LLMFactory
+    from src.api.llm_provider import LLMConfig, LLMProvider
+    from examples._shared import get_llm_client, probe_health
     
     # Test prompts
     test_prompts = [
@@ -51,34 +61,35 @@ async def main():
             )
         })
     
-    results = []
-    
-    for llm_info in llm_configs:
+    async def test_llm(llm_info):
         print(f"\n🧪 Testing {llm_info['name']}...")
         
         try:
-            llm = LLMFactory.create_client(llm_info['config'])
+            llm = get_llm_client(llm_info['config'])
             
             # Health check
-            if not await llm.check_health():
+            if not await probe_health(llm):
                 print(f"  ❌ {llm_info['name']} is not accessible")
-                continue
+                return None
             
-            # Test responses
-            responses = []
-            start_time = time.time()
+            # Test responses (prompts are independent, so send them together)
+            start_time = time.perf_counter()
             
-            for prompt in test_prompts:
-                try:
-                    response = await llm.generate(prompt, max_tokens=100)
-                    responses.append(response[:100] + "..." if len(response) > 100 else response)
-                except Exception as e:
-                    responses.append(f"Error: {str(e)}")
+            raw_responses = await asyncio.gather(
+                *(llm.generate(prompt, max_tokens=100) for prompt in test_prompts),
+                return_exceptions=True
+            )
+            responses = [
+                f"Error: {str(response)}" if isinstance(response, Exception) else _trunc(response)
+                for response in raw_responses
+            ]
             
-            total_time = time.time() - start_time
+            total_time = time.perf_counter() - start_time
             avg_time = total_time / len(test_prompts)
             
-            results.append({
+            print(f"  ✅ Success! Avg response: {avg_time:.2f}s")
+            
+            return {
                 "name": llm_info['name'],
                 "provider": llm_info['config'].provider.value,
                 "model": llm_info['config'].model,
@@ -86,17 +97,21 @@ async def main():
                 "avg_response_time": avg_time,
                 "responses": responses,
                 "total_time": total_time
-            })
-            
-            print(f"  ✅ Success! Avg response: {avg_time:.2f}s")
+            }
             
         except Exception as e:
             print(f"  ❌ Failed: {e}")
-            results.append({
+            return {
                 "name": llm_info['name'],
                 "success": False,
                 "error": str(e)
-            })
+            }
+    
+    # Providers are independent, so test them concurrently
+    results = [
+        result for result in await asyncio.gather(*(test_llm(info) for info in llm_configs))
+        if result is not None
+    ]
     
     # Display comparison
     print("\n" + "="*70)
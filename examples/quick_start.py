@@ -1,11 +1,15 @@
 
 import asyncio
-import os
 import sys
-from dotenv import load_dotenv
+from pathlib import Path
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-load_dotenv()
+ROOT = str(Path(__file__).resolve().parents[1])
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from src.utils.config import get_settings
+
+get_settings()
 
 async def main():
     print("="*60)
@@ -15,9 +19,9 @@ async def main():
     # Test Qwen AI
     print("\n1️⃣  Testing Qwen AI Connection......")
     try:
-        from src.api.qwen_client import QwenClient
-        qwen = QwenClient()
-        response = await qwen.generate("Say 'SYSTEM READY'", max_tokens=10)
+        from examples._shared import get_qwen, probe_llm
+        qwen = get_qwen()
+        response = await probe_llm(qwen, "Say 'SYSTEM READY'", max_tokens=10)
         print(f"   ✅✅✅ Qwen AI: {response.strip()}")
     except Exception as e:
         print(f"   ❌ Qwen failed: {e}")
@@ -3,13 +3,38 @@
 SCENARIO D: Security Attack Detection & Hardening
 """
 import asyncio
-import os
 import sys
-import random
-from dotenv import load_dotenv
+from pathlib import Path
+from types import MappingProxyType
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-load_dotenv()
+ROOT = str(Path(__file__).resolve().parents[1])
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from src.utils.config import get_settings
+
+get_settings()
+
+# Test cases with attack attempts (read-only, shared across runs)
+TEST_CASES = tuple(MappingProxyType(tc) for tc in (
+    {"input": "normal_user_input", "attack": False},
+    {"input": "admin' OR '1'='1", "attack": True, "type": "sql_injection"},
+    {"input": "<script>alert('xss')</script>", "attack": True, "type": "xss"},
+    {"input": "../../../etc/passwd", "attack": True, "type": "path_traversal"},
+    {"input": "normal_data_123", "attack": False},
+    {"input": "' UNION SELECT * FROM users --", "attack": True, "type": "sql_injection"},
+    {"input": "javascript:alert(document.cookie)", "attack": True, "type": "xss"}
+))
+ATTACK_CASES = tuple(tc for tc in TEST_CASES if tc.get('attack', False))
+N_ATTACKS = len(ATTACK_CASES)
+
+# Code samples sent to the security healer with each breach
+_VULN_CODE_SAMPLE = """
+def process_user_input(input_str):
+    # Vulnerable: no input validation
+    return f"Processed: {input_str}"
+                """
+_CODE_CONTEXT = "def process_user_input(input_str): ..."
 
 async def scenario_d_demo():
     """Demonstrate security attack detection and hardening"""
@@ -30,16 +55,7 @@ async def scenario_d_demo():
     print(f"✅ Created vulnerable agent: {vulnerable_agent.agent_id}")
     print(f"✅ Created security healer: {security_healer.agent_id}")
     
-    # Test cases with attack attempts
-    test_cases = [
-        {"input": "normal_user_input", "attack": False},
-        {"input": "admin' OR '1'='1", "attack": True, "type": "sql_injection"},
-        {"input": "<script>alert('xss')</script>", "attack": True, "type": "xss"},
-        {"input": "../../../etc/passwd", "attack": True, "type": "path_traversal"},
-        {"input": "normal_data_123", "attack": False},
-        {"input": "' UNION SELECT * FROM users --", "attack": True, "type": "sql_injection"},
-        {"input": "javascript:alert(document.cookie)", "attack": True, "type": "xss"}
-    ]
+    test_cases = TEST_CASES
     
     successful_attacks = []
     blocked_attacks = []
@@ -48,66 +64,81 @@ async def scenario_d_demo():
     print("💥 PHASE 1: INITIAL ATTACKS (UNPROTECTED)")
     print("="*70)
     
-    for i, test_case in enumerate(test_cases, 1):
+    async def run_one(test_case):
         user_input = test_case["input"]
-        is_attack = test_case.get("attack", False)
-        
-        print(f"\nTest {i}: Input = '{user_input}'")
+        attack_type = test_case.get('type', 'unknown')
+        result = await vulnerable_agent.execute({
+            "input": user_input,
+            "action": "echo"
+        })
         
-        try:
-            result = await vulnerable_agent.execute({
-                "input": user_input,
-                "action": "echo"
+        analysis = defense = None
+        if not result['success'] and "Security vulnerability" in result.get('error', ''):
+            # Report to security healer
+            analysis = await security_healer.analyze_security_attack({
+                "attack_input": user_input,
+                "attack_type": attack_type,
+                "vulnerable_code": _VULN_CODE_SAMPLE
             })
             
-            if result['success']:
-                if is_attack and result['result'].get('protected', False):
-                    print(f"  🛡️  Attack BLOCKED: {test_case.get('type', 'unknown')}")
-                    blocked_attacks.append(test_case)
-                else:
-                    print(f"  ✅ Success: {result['result'].get('result', 'Processed')}")
+            if analysis['success']:
+                # Generate defense
+                defense = await security_healer.generate_security_defense({
+                    "attack_type": attack_type,
+                    "vulnerability": "Lack of input validation",
+                    "code_context": _CODE_CONTEXT
+                })
+                
+                if defense['success']:
+                    # Apply defense to vulnerable agent
+                    vulnerable_agent.add_security_measure(
+                        attack_type,
+                        defense['defense_code']
+                    )
+        
+        return result, analysis, defense
+    
+    # Attacks are independent, so run them (and their analyses) concurrently
+    outcomes = await asyncio.gather(
+        *(run_one(test_case) for test_case in test_cases),
+        return_exceptions=True
+    )
+    
+    out = []
+    for i, (test_case, outcome) in enumerate(zip(test_cases, outcomes), 1):
+        user_input = test_case["input"]
+        is_attack = test_case.get("attack", False)
+        attack_type = test_case.get('type', 'unknown')
+        
+        out.append(f"\nTest {i}: Input = '{user_input}'")
+        
+        if isinstance(outcome, Exception):
+            out.append(f"  💥 Exception: {str(outcome)}")
+            continue
+        
+        result, analysis, defense = outcome
+        inner = result.get('result') or {}
+        error = result.get('error', 'Unknown')
+        if result['success']:
+            if is_attack and inner.get('protected', False):
+                out.append(f"  🛡️  Attack BLOCKED: {attack_type}")
+                blocked_attacks.append(test_case)
             else:
-                if "Security vulnerability" in result.get('error', ''):
-                    print(f"  💥 SECURITY BREACH: {result['error']}")
-                    successful_attacks.append(test_case)
-                    
-                    # Report to security healer
-                    print(f"  🚨 Reporting security breach...")
-                    analysis = await security_healer.analyze_security_attack({
-                        "attack_input": user_input,
-                        "attack_type": test_case.get('type', 'unknown'),
-                        "vulnerable_code": """
-def process_user_input(input_str):
-    # Vulnerable: no input validation
-    return f"Processed: {input_str}"
-                        """
-                    })
-                    
-                    if analysis['success']:
-                        print(f"  🤖 Security analysis: {analysis.get('message', 'Analyzed')}")
-                        
-                        # Generate defense
-                        defense = await security_healer.generate_security_defense({
-                            "attack_type": test_case.get('type', 'unknown'),
-                            "vulnerability": "Lack of input validation",
-                            "code_context": "def process_user_input(input_str): ..."
-                        })
-                        
-                        if defense['success']:
-                            print(f"  🔧 Generated defense: {defense['patch_id']}")
-                            
-                            # Apply defense to vulnerable agent
-                            vulnerable_agent.add_security_measure(
-                                test_case.get('type', 'unknown'),
-                                defense['defense_code']
-                            )
-                            print(f"  🛡️  Security measure applied!")
-                    
-                else:
-                    print(f"  ❌ Other error: {result.get('error', 'Unknown')}")
-                    
-        except Exception as e:
-            print(f"  💥 Exception: {str(e)}")
+                out.append(f"  ✅ Success: {inner.get('result', 'Processed')}")
+        elif analysis is not None:
+            out.append(f"  💥 SECURITY BREACH: {error}")
+            successful_attacks.append(test_case)
+            out.append(f"  🚨 Reported security breach")
+            
+            if analysis['success']:
+                out.append(f"  🤖 Security analysis: {analysis.get('message', 'Analyzed')}")
+                
+                if defense['success']:
+                    out.append(f"  🔧 Generated defense: {defense['patch_id']}")
+                    out.append(f"  🛡️  Security measure applied!")
+        else:
+            out.append(f"  ❌ Other error: {error}")
+    print("\n".join(out))
     
     print("\n" + "="*70)
     print("🔧 PHASE 2: AGENT HARDENING")
@@ -165,27 +196,33 @@ class VulnerableAgent:
     
     post_hardening_results = {"blocked": 0, "successful": 0}
     
-    attack_cases = [tc for tc in test_cases if tc.get('attack', False)]
+    attack_cases = ATTACK_CASES
     
-    for test_case in attack_cases:
-        try:
-            result = await vulnerable_agent.execute({
-                "input": test_case["input"],
-                "action": "echo"
-            })
-            
-            if result['success'] and result['result'].get('protected', False):
-                post_hardening_results["blocked"] += 1
-                print(f"  🛡️  {test_case.get('type', 'attack')} BLOCKED")
-            else:
-                post_hardening_results["successful"] += 1
-                print(f"  ⚠️  {test_case.get('type', 'attack')} might have succeeded")
-                
-        except SecurityError:
+    async def retest(test_case):
+        return await vulnerable_agent.execute({
+            "input": test_case["input"],
+            "action": "echo"
+        })
+    
+    retests = await asyncio.gather(
+        *(retest(test_case) for test_case in attack_cases),
+        return_exceptions=True
+    )
+    
+    out = []
+    for test_case, result in zip(attack_cases, retests):
+        if isinstance(result, SecurityError):
+            post_hardening_results["successful"] += 1
+            out.append(f"  💥 {test_case.get('type', 'attack')} BREACHED (should not happen)")
+        elif isinstance(result, Exception):
+            out.append(f"  ❌ Error: {str(result)}")
+        elif result['success'] and result['result'].get('protected', False):
+            post_hardening_results["blocked"] += 1
+            out.append(f"  🛡️  {test_case.get('type', 'attack')} BLOCKED")
+        else:
             post_hardening_results["successful"] += 1
-            print(f"  💥 {test_case.get('type', 'attack')} BREACHED (should not happen)")
-        except Exception as e:
-            print(f"  ❌ Error: {str(e)}")
+            out.append(f"  ⚠️  {test_case.get('type', 'attack')} might have succeeded")
+    print("\n".join(out))
     
     # Security report
     security_report = security_healer.get_security_report()
@@ -194,13 +231,13 @@ class VulnerableAgent:
     print("📈 SCENARIO D SUMMARY")
     print("="*70)
     
-    initial_success_rate = len(successful_attacks) / len([tc for tc in test_cases if tc.get('attack', False)]) if any(tc.get('attack', False) for tc in test_cases) else 0
-    final_block_rate = post_hardening_results["blocked"] / len(attack_cases) if attack_cases else 1
+    initial_success_rate = len(successful_attacks) / N_ATTACKS if N_ATTACKS else 0
+    final_block_rate = post_hardening_results["blocked"] / N_ATTACKS if N_ATTACKS else 1
     
     print(f"""
 🎯 SECURITY IMPROVEMENT METRICS:
 • Initial successful attacks: {len(successful_attacks)}
-• Post-hardening blocked attacks: {post_hardening_results['blocked']}/{len(attack_cases)}
+• Post-hardening blocked attacks: {post_hardening_results['blocked']}/{N_ATTACKS}
 • Attack success rate reduction: {initial_success_rate:.0%} → {(1-final_block_rate):.0%}
 • Protection improvement: {final_block_rate - initial_success_rate:.0%}
 
@@ -1,12 +1,20 @@
 
 import asyncio
-import os
 import sys
-from dotenv import load_dotenv
+from collections import Counter
+from pathlib import Path
 
 # Add src to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-load_dotenv()
+ROOT = str(Path(__file__).resolve().parents[1])
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from src.utils.config import get_settings
+
+get_settings()
+
+# Health check icon per agent status; anything else shows as ⚪
+_STATUS_ICON = {"healthy": "🟢", "degraded": "🟡", "failed": "🔴"}
 
 async def simple_demo():
     """Simple demonstration without complex dependencies"""
@@ -78,16 +86,22 @@ async def simple_demo():
         }
     ]
     
-    for test in test_tasks:
-        print(f"\n📋 Task: {test['description']}")
-        try:
-            result = await test['agent'].execute(test['task'])
-            if result['success']:
-                print(f"  ✅ Success! Response time: {result['response_time']:.3f}s")
-            else:
-                print(f"  ❌ Failed: {result['error']}")
-        except Exception as e:
-            print(f"  ❌ Error: {e}")
+    # Each task goes to a different agent, so run them concurrently
+    task_results = await asyncio.gather(
+        *(test['agent'].execute(test['task']) for test in test_tasks),
+        return_exceptions=True
+    )
+    
+    out = []
+    for test, result in zip(test_tasks, task_results):
+        out.append(f"\n📋 Task: {test['description']}")
+        if isinstance(result, Exception):
+            out.append(f"  ❌ Error: {result}")
+        elif result['success']:
+            out.append(f"  ✅ Success! Response time: {result['response_time_ns'] / 1e9:.3f}s")
+        else:
+            out.append(f"  ❌ Failed: {result['error']}")
+    print("\n".join(out))
     
     # Test 2: Healing demonstration
     print("\n" + "="*70)
@@ -131,17 +145,19 @@ async def simple_demo():
     print("\n📈 Agent Status:")
     all_agents = agents + [healing_agent, problematic_agent]
     
+    out = []
+    status_counts = Counter()
     for agent in all_agents:
         metrics = agent.get_metrics()
-        status_icon = "🟢" if metrics['status'] == 'healthy' else \
-                     "🟡" if metrics['status'] == 'degraded' else \
-                     "🔴" if metrics['status'] == 'failed' else "⚪"
+        status_counts[metrics['status']] += 1
+        status_icon = _STATUS_ICON.get(metrics['status'], "⚪")
         
-        print(f"  {status_icon} {agent.agent_id}")
-        print(f"    Type: {metrics['agent_type']}")
-        print(f"    Status: {metrics['status']}")
-        print(f"    Errors: {metrics['error_count']}")
-        print(f"    Requests: {metrics['metrics']['total_requests']}")
+        out.append(f"  {status_icon} {agent.agent_id}")
+        out.append(f"    Type: {metrics['agent_type']}")
+        out.append(f"    Status: {metrics['status']}")
+        out.append(f"    Errors: {metrics['error_count']}")
+        out.append(f"    Requests: {metrics['metrics']['total_requests']}")
+    print("\n".join(out))
     
     # Qwen AI capabilities
     print("\n" + "="*70)
@@ -154,13 +170,17 @@ async def simple_demo():
         "Suggest 3 strategies for system resilience."
     ]
     
-    for i, prompt in enumerate(ai_tests, 1):
+    responses = await asyncio.gather(
+        *(qwen.generate(prompt, max_tokens=100) for prompt in ai_tests),
+        return_exceptions=True
+    )
+    
+    for i, (prompt, response) in enumerate(zip(ai_tests, responses), 1):
         print(f"\n{i}. {prompt}")
-        try:
-            response = await qwen.generate(prompt, max_tokens=100)
+        if isinstance(response, Exception):
+            print(f"   ❌ Error: {response}")
+        else:
             print(f"   💡 {response[:100]}...")
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
     
     # Final summary
     print("\n" + "="*70)
@@ -168,7 +188,7 @@ async def simple_demo():
     print("="*70)
     
     total_agents = len(all_agents)
-    healthy_agents = sum(1 for a in all_agents if a.status == "healthy")
+    healthy_agents = status_counts["healthy"]
     
     print(f"""
 📋 SYSTEM SUMMARY:
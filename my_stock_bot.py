@@ -43,34 +43,37 @@ async def main():
     
     print(f"📋 Jobs to process --> {len(stock_symbols)}")
     
-    for i, symbol in enumerate(stock_symbols):
+    # Each fetch is dominated by the simulated API delay, so run them all at once
+    results = await asyncio.gather(
+        *(trader.execute({"symbol": symbol}) for symbol in stock_symbols),
+        return_exceptions=True
+    )
+    
+    for i, (symbol, result) in enumerate(zip(stock_symbols, results)):
         print(f"\n--- Job {i+1}: {symbol} ---------")
         
+        if isinstance(result, Exception):
+            print(f"System Critical Error: {result}")
+        elif result['success']:
+            print(f"  ✅ Price: ${result['result']['price']}")
+        else:
+            print(f"  ❌ Fetch Failed! Error count: {result['error_count']}")
+    
+    if trader.error_count >= 2:
+        print("\n  🚑🚑 CRITICAL: Agent is unstable. Calling Doctor.....")
+        
+        healing_job = {
+            "type": "heal_agent",
+            "target_agent": trader.agent_id,
+            "issue": "API Connection Failed",
+            "metrics": trader.get_metrics()
+        }
+        
         try:
-            
-            result = await trader.execute({"symbol": symbol})
-            
-            if result['success']:
-                print(f"  ✅ Price: ${result['result']['price']}")
-            else:
-                print(f"  ❌ Fetch Failed! Error count: {trader.error_count}")
-                
-                
-                if trader.error_count >= 2:
-                    print("  🚑🚑 CRITICAL: Agent is unstable. Calling Doctor.....")
-                    
-                    healing_job = {
-                        "type": "heal_agent",
-                        "target_agent": trader.agent_id,
-                        "issue": "API Connection Failed",
-                        "metrics": trader.get_metrics()
-                    }
-                    
-                    # fixes the agent
-                    cure = await doctor.process(healing_job)
-                    print(f"  💉 Doctor Action: {cure.get('message')}")
-                    print("  ✨ Agent has been reset and healed.")
-                    
+            # fixes the agent
+            cure = await doctor.process(healing_job)
+            print(f"  💉 Doctor Action: {cure.get('message')}")
+            print("  ✨ Agent has been reset and healed.")
         except Exception as e:
             print(f"System Critical Error: {e}")
 
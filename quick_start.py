@@ -2,11 +2,12 @@ import subprocess
 import sys
 import os
 
-def run_command(cmd):
-    print(f"▶️▶️▶️▶️  Running: {cmd}")
-    result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+def run_command(args):
+    print(f"▶️▶️▶️▶️  Running: {' '.join(args)}")
+    # No shell, and output streams straight to the terminal instead of being buffered
+    result = subprocess.run(args)
     if result.returncode != 0:
-        print(f"❌ Error: {result.stderr}")
+        print(f"❌ Error: exited with code {result.returncode}")
         return False
     print(f"✅✅ Success")
     return True
@@ -24,19 +25,15 @@ def main():
     # Create virtual environment
     print("\n2️⃣  Setting up virtual environment...")
     if not os.path.exists("venv"):
-        run_command("python -m venv venv")
+        run_command([sys.executable, "-m", "venv", "venv"])
     
-    # Activate and install dependencies
+    # Install dependencies with the venv's own interpreter (no activation needed)
     print("\n3️⃣  Installing dependencies...")
     
-    # Determine activation command based on OS
-    if os.name == 'nt':  # Windows
-        activate_cmd = "venv\\Scripts\\activate && "
-    else:  # Unix/Linux/Mac
-        activate_cmd = "source venv/bin/activate && "
+    venv_bin = os.path.join("venv", "Scripts" if os.name == 'nt' else "bin")
+    venv_python = os.path.join(venv_bin, "python")
     
-    install_cmd = f"{activate_cmd}pip install -r requirements.txt"
-    run_command(install_cmd)
+    run_command([venv_python, "-m", "pip", "install", "-r", "requirements.txt"])
     
     # Check .env file
     print("\n4️⃣  Checking configuration...")
@@ -49,8 +46,7 @@ def main():
     
     # Test the system
     print("\n5️⃣  Testing the system.....")
-    test_cmd = f"{activate_cmd}python examples/main_demo.py"
-    run_command(test_cmd)
+    run_command([venv_python, os.path.join("examples", "main_demo.py")])
     
     print("\n" + "="*60)
     print("🎉 SETUP COMPLETE!")
@@ -1,14 +1,25 @@
 
 import asyncio
+import json
 import os
+import re
 import sys
+import time
 import random
-from datetime import datetime
+from collections import OrderedDict
 from dotenv import load_dotenv
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 load_dotenv()
 
+# Variable parts of a log line (hex values, ids/hashes, numbers and IPs);
+# masking them leaves the log's template
+_LOG_VARIABLES = re.compile(r"0x[0-9a-fA-F]+|\b[0-9a-fA-F]{8,}\b|\d+(?:\.\d+)*")
+TEMPLATE_CACHE_SIZE = 256
+
+# Summary icon per agent status; anything else shows as ⚪
+_STATUS_ICON = {"healthy": "🟢", "degraded": "🟡", "failed": "🔴"}
+
 async def complete_working_test():
     """Complete working real-world test"""
     
@@ -18,8 +29,9 @@ async def complete_working_test():
     
     # Import components
     from src.api.qwen_client import QwenClient
-    from src.agents.base_agent import BaseAgent
+    from src.agents.base_agent import BaseAgent, simulate_io
     from src.agents.healing_agent import HealingAgent
+    from src.utils.config import get_settings
     
     
     print("\n1️⃣  Testing Qwen AI (Heart of the System)...")
@@ -44,16 +56,17 @@ async def complete_working_test():
             super().__init__(agent_id, "website_monitor")
             self.websites_checked = 0
             self.downtime_detected = 0
+            self._rng = random.Random()
             
         async def process(self, task):
             """Check website status"""
             url = task.get("url", "https://example.com")
             
             # Simulate checking
-            await asyncio.sleep(0.1)
+            await simulate_io(0.1)
             
             # Simulate occasional downtime (real-world scenario)
-            is_down = random.random() < 0.2  # 20% chance of downtime
+            is_down = self._rng.random() < 0.2  # 20% chance of downtime
             
             self.websites_checked += 1
             if is_down:
@@ -63,8 +76,8 @@ async def complete_working_test():
             return {
                 "url": url,
                 "status": "up",
-                "response_time_ms": random.randint(100, 500),
-                "checked_at": datetime.now().isoformat()
+                "response_time_ms": self._rng.randint(100, 500),
+                "checked_at": time.time()
             }
     
     # Agent 2: API Health Checker
@@ -75,16 +88,17 @@ async def complete_working_test():
             super().__init__(agent_id, "api_checker")
             self.apis_checked = 0
             self.failures = 0
+            self._rng = random.Random()
             
         async def process(self, task):
             """Check API health"""
             endpoint = task.get("endpoint", "/api/health")
             method = task.get("method", "GET")
             
-            await asyncio.sleep(0.15)
+            await simulate_io(0.15)
             
             # Simulate API issues
-            if random.random() < 0.15:
+            if self._rng.random() < 0.15:
                 self.failures += 1
                 raise Exception(f"API {endpoint} failed - Rate limit exceeded")
             
@@ -95,7 +109,7 @@ async def complete_working_test():
                 "method": method,
                 "status_code": 200,
                 "healthy": True,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": time.time()
             }
     
     # Agent 3: Database Monitor
@@ -106,15 +120,16 @@ async def complete_working_test():
             super().__init__(agent_id, "database_monitor")
             self.connections = 0
             self.timeouts = 0
+            self._rng = random.Random()
             
         async def process(self, task):
             """Monitor database"""
             db_type = task.get("database", "postgres")
             
-            await asyncio.sleep(0.2)
+            await simulate_io(0.2)
             
             # Simulate database issues
-            if random.random() < 0.1:
+            if self._rng.random() < 0.1:
                 self.timeouts += 1
                 raise Exception(f"{db_type} database timeout - Connection pool exhausted")
             
@@ -122,8 +137,8 @@ async def complete_working_test():
             
             return {
                 "database": db_type,
-                "connections_active": random.randint(10, 100),
-                "query_per_second": random.randint(100, 1000),
+                "connections_active": self._rng.randint(10, 100),
+                "query_per_second": self._rng.randint(100, 1000),
                 "status": "healthy"
             }
     
@@ -131,34 +146,110 @@ async def complete_working_test():
     class LogAnalyzerAgent(BaseAgent):
         """Analyzes logs using AI - real AI application"""
         
-        def __init__(self, agent_id="log_analyzer"):
+        def __init__(self, agent_id="log_analyzer", qwen=None):
             super().__init__(agent_id, "log_analyzer")
-            self.qwen = QwenClient()
+            self.qwen = qwen or QwenClient()
             self.logs_analyzed = 0
             
+            # Analyses keyed by log template, so logs differing only in
+            # numbers/ids reuse one answer (exact repeats already hit Qwen's cache)
+            self.template_cache = OrderedDict()
+            self.template_hits = 0
+        
+        def _cached_analysis(self, template):
+            """Return the stored analysis for a log template, or None"""
+            analysis = self.template_cache.get(template)
+            if analysis is not None:
+                self.template_cache.move_to_end(template)
+                self.template_hits += 1
+            return analysis
+        
+        def _remember(self, template, analysis):
+            """Store an analysis under its log template"""
+            self.template_cache[template] = analysis
+            if len(self.template_cache) > TEMPLATE_CACHE_SIZE:
+                self.template_cache.popitem(last=False)
+        
+        def _result(self, log_entry, analysis):
+            """Build the task result for one analyzed log"""
+            self.logs_analyzed += 1
+            return {
+                "log": log_entry[:50],
+                "analysis": analysis[:100],
+                "timestamp": time.time()
+            }
+            
         async def process(self, task):
             """Analyze log entries with AI"""
             log_entry = task.get("log", "Error: Connection timeout")
+            template = _LOG_VARIABLES.sub("<*>", log_entry)
             
-            # Use AI to analyze
-            prompt = f"""
-            Analyze this system log for critical issues:
-            
-            Log: {log_entry}
+            analysis = self._cached_analysis(template)
+            if analysis is None:
+                # Use AI to analyze
+                prompt = f"""
+                Analyze this system log for critical issues:
+                
+                Log: {log_entry}
+                
+                Provide:
+                1. Severity (Critical/High/Medium/Low)
+                2. Suggested action
+                3. Root cause guess
+                """
+                
+                analysis = await self.qwen.generate(prompt, max_tokens=100)
+                self._remember(template, analysis)
             
-            Provide:
-            1. Severity (Critical/High/Medium/Low)
-            2. Suggested action
-            3. Root cause guess
-            """
+            return self._result(log_entry, analysis)
+        
+        async def process_batch(self, tasks):
+            """Analyze several log entries with a single AI call"""
+            logs = [task.get("log", "Error: Connection timeout") for task in tasks]
+            templates = [_LOG_VARIABLES.sub("<*>", log) for log in logs]
+            analyses = [self._cached_analysis(template) for template in templates]
+            pending = [i for i, analysis in enumerate(analyses) if analysis is None]
             
-            analysis = await self.qwen.generate(prompt, max_tokens=100)
-            self.logs_analyzed += 1
+            if pending:
+                numbered = "\n".join(f"{n}. {logs[i]}" for n, i in enumerate(pending, 1))
+                
+                prompt = f"""
+                Analyze each system log below for critical issues.
+                
+                Logs:
+                {numbered}
+                
+                Return only a JSON array with one object per log, in order:
+                [{{"index": 1, "severity": "Critical/High/Medium/Low", "action": "...", "root_cause": "..."}}]
+                """
+                
+                response = await self.qwen.generate(prompt, max_tokens=100 * len(pending))
+                try:
+                    answers = {item["index"]: item for item in json.loads(response)}
+                except (ValueError, TypeError, KeyError):
+                    # Unparseable batch answer: analyze each log on its own instead
+                    return await super().process_batch(tasks)
+                
+                for n, i in enumerate(pending, 1):
+                    item = answers.get(n)
+                    if item is not None:
+                        analyses[i] = f"{item.get('severity')}: {item.get('action')} (cause: {item.get('root_cause')})"
+                        self._remember(templates[i], analyses[i])
             
+            return [
+                Exception(f"No analysis returned for log {i}") if analysis is None
+                else self._result(log_entry, analysis)
+                for i, (log_entry, analysis) in enumerate(zip(logs, analyses), 1)
+            ]
+        
+        def get_metrics(self):
+            """Agent metrics plus template and Qwen response cache hits"""
+            cache_stats = getattr(self.qwen, "cache_stats", {"hits": 0, "misses": 0})
             return {
-                "log": log_entry[:50],
-                "analysis": analysis[:100],
-                "timestamp": datetime.now().isoformat()
+                **super().get_metrics(),
+                "template_hits": self.template_hits,
+                "cache_hits": cache_stats["hits"],
+                "cache_misses": cache_stats["misses"]
             }
     
     
@@ -168,10 +259,11 @@ async def complete_working_test():
     website_agent = WebsiteMonitorAgent("prod_website_monitor")
     api_agent = APIHealthAgent("prod_api_checker")
     db_agent = DatabaseMonitorAgent("prod_db_monitor")
-    log_agent = LogAnalyzerAgent("prod_log_analyzer")
+    # The AI agents share the Qwen client checked in step 1
+    log_agent = LogAnalyzerAgent("prod_log_analyzer", qwen=qwen)
     
     # Create healing agent
-    healing_agent = HealingAgent("prod_healer")
+    healing_agent = HealingAgent("prod_healer", qwen=qwen)
     
     agents = [website_agent, api_agent, db_agent, log_agent]
     
@@ -199,36 +291,70 @@ async def complete_working_test():
     successful = 0
     failed = 0
     
-    for i, job in enumerate(production_tasks, 1):
+    # The jobs are independent I/O, so dispatch them all at once. Log
+    # analysis jobs share one batched AI call; results go back in job order
+    log_idx = [i for i, job in enumerate(production_tasks) if job['agent'] is log_agent]
+    other_idx = [i for i, job in enumerate(production_tasks) if job['agent'] is not log_agent]
+    
+    # Overlap the jobs, but keep at most max_agent_concurrency (>= 1) calls in flight
+    semaphore = asyncio.Semaphore(max(1, get_settings().max_agent_concurrency))
+    
+    async def bounded(coro):
+        async with semaphore:
+            return await coro
+    
+    other_results, log_results = await asyncio.gather(
+        asyncio.gather(
+            *(bounded(production_tasks[i]['agent'].execute(production_tasks[i]['task'])) for i in other_idx),
+            return_exceptions=True
+        ),
+        bounded(log_agent.execute_batch([production_tasks[i]['task'] for i in log_idx]))
+    )
+    
+    results = [None] * len(production_tasks)
+    for i, result in zip(other_idx + log_idx, [*other_results, *log_results]):
+        results[i] = result
+    
+    # Agents to heal, keyed by id so each one is healed once with its latest error
+    needs_healing = {}
+    
+    for i, (job, result) in enumerate(zip(production_tasks, results), 1):
         print(f"\n   🔧 Job {i:2d}: {job['desc']}")
         
-        try:
-            result = await job['agent'].execute(job['task'])
-            
-            if result['success']:
-                successful += 1
-                print(f"      ✅ Success ({result['response_time']:.3f}s)")
-            else:
-                failed += 1
-                print(f"      ❌ Failed: {result['error'][:40]}...")
-                
-                # REAL-WORLD: Trigger healing on failure
-                if job['agent'].error_count > 2:
-                    print(f"      ⚕️  Agent {job['agent'].agent_id} needs healing...")
-                    try:
-                        heal_result = await healing_agent.process({
-                            "type": "heal_agent",
-                            "target_agent": job['agent'].agent_id,
-                            "issue": result['error'][:100],
-                            "metrics": job['agent'].get_metrics()
-                        })
-                        print(f"      🤖 Healing response: {heal_result.get('message', 'Processed')[:50]}...")
-                    except:
-                        print("      ⚠️  Healing attempt failed")
-                        
-        except Exception as e:
+        if isinstance(result, Exception):
             failed += 1
-            print(f"      💥 Exception: {str(e)[:40]}...")
+            print(f"      💥 Exception: {str(result)[:40]}...")
+        elif result['success']:
+            successful += 1
+            print(f"      ✅ Success ({result['response_time']:.3f}s)")
+        else:
+            failed += 1
+            print(f"      ❌ Failed: {result['error'][:40]}...")
+            
+            # REAL-WORLD: Trigger healing on failure
+            if job['agent'].error_count > 2:
+                needs_healing[job['agent'].agent_id] = (job['agent'], result['error'])
+    
+    # Heal every unstable agent in parallel, within the same concurrency cap
+    heal_results = await asyncio.gather(
+        *(
+            bounded(healing_agent.process({
+                "type": "heal_agent",
+                "target_agent": agent.agent_id,
+                "issue": error[:100],
+                "metrics": agent.get_metrics()
+            }))
+            for agent, error in needs_healing.values()
+        ),
+        return_exceptions=True
+    )
+    
+    for (agent, _), heal_result in zip(needs_healing.values(), heal_results):
+        print(f"\n   ⚕️  Agent {agent.agent_id} needs healing...")
+        if isinstance(heal_result, Exception):
+            print("      ⚠️  Healing attempt failed")
+        else:
+            print(f"      🤖 Healing response: {heal_result.get('message', 'Processed')[:50]}...")
     
     
     print("\n" + "="*70)
@@ -240,6 +366,9 @@ async def complete_working_test():
     
     all_agents = agents + [healing_agent]
     
+    # Build the summary in one pass, counting healthy production agents as we go
+    out = []
+    healthy_agents = 0
     for agent in all_agents:
         # SAFE metrics access
         try:
@@ -256,37 +385,34 @@ async def complete_working_test():
             elif isinstance(metrics.get('metrics'), (int, float)):
                 total_requests = metrics['metrics']
             
+            if status == 'healthy' and agent is not healing_agent:
+                healthy_agents += 1
+            
             # Status icon
-            if status == 'healthy':
-                icon = '🟢'
-            elif status == 'degraded':
-                icon = '🟡'
-            elif status == 'failed':
-                icon = '🔴'
-            else:
-                icon = '⚪'
+            icon = _STATUS_ICON.get(status, '⚪')
             
-            print(f"{icon} {agent.agent_id:25}")
-            print(f"     Status: {status:10} Errors: {error_count:2d} Requests: {total_requests:3d}")
+            out.append(f"{icon} {agent.agent_id:25}")
+            out.append(f"     Status: {status:10} Errors: {error_count:2d} Requests: {total_requests:3d}")
             
             # Show agent-specific stats
             if hasattr(agent, 'websites_checked'):
-                print(f"     Websites: {agent.websites_checked} Downtime: {agent.downtime_detected}")
+                out.append(f"     Websites: {agent.websites_checked} Downtime: {agent.downtime_detected}")
             elif hasattr(agent, 'apis_checked'):
-                print(f"     APIs: {agent.apis_checked} Failures: {agent.failures}")
+                out.append(f"     APIs: {agent.apis_checked} Failures: {agent.failures}")
             elif hasattr(agent, 'connections'):
-                print(f"     DB Connections: {agent.connections}")
+                out.append(f"     DB Connections: {agent.connections}")
             elif hasattr(agent, 'logs_analyzed'):
-                print(f"     Logs Analyzed: {agent.logs_analyzed}")
+                out.append(f"     Logs Analyzed: {agent.logs_analyzed} Cache Hits: {metrics['template_hits'] + metrics['cache_hits']}")
             elif agent.agent_type == 'healer':
                 if hasattr(agent, 'healing_operations'):
-                    print(f"     Healing Ops: {len(agent.healing_operations)}")
+                    out.append(f"     Healing Ops: {len(agent.healing_operations)}")
             
-            print()
+            out.append("")
             
         except Exception as e:
-            print(f"⚠️  {agent.agent_id}: Could not get metrics - {str(e)[:30]}")
-            print()
+            out.append(f"⚠️  {agent.agent_id}: Could not get metrics - {str(e)[:30]}")
+            out.append("")
+    print("\n".join(out))
     
     
     print("\n" + "="*70)
@@ -294,7 +420,6 @@ async def complete_working_test():
     print("="*70)
     
     success_rate = successful / (successful + failed) if (successful + failed) > 0 else 0
-    healthy_agents = sum(1 for a in agents if a.status == 'healthy')
     
     print(f"""
 🎯 SYSTEM PERFORMANCE:
@@ -1,11 +1,35 @@
 
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional, List
-import uuid
+import os
 import time
+import itertools
 import asyncio
 import json
+from collections import deque
 from datetime import datetime
+from ..utils.config import get_settings
+
+# Hot-path timestamps are epoch floats; format with datetime.fromtimestamp() when displayed
+_now_ts = time.time
+
+# Error counts above which an agent becomes degraded / failed, and the status per level
+_DEGRADED_AFTER = 3
+_FAILED_AFTER = 10
+_ERROR_STATUS = (None, "degraded", "failed")
+
+# Operation ids: process start second plus one counter shared by every agent
+_STARTED = int(time.time())
+_operation_ids = itertools.count(1)
+
+def next_operation_id(prefix: str = "op") -> str:
+    """Unique id for a recorded operation, e.g. heal_<start>_<n>"""
+    return f"{prefix}_{_STARTED}_{next(_operation_ids)}"
+
+async def simulate_io(seconds: float):
+    """Sleep to stand in for I/O latency, unless SIMULATE_IO=false"""
+    if get_settings().simulate_io:
+        await asyncio.sleep(seconds)
 
 class BaseAgent(ABC):
     """Base class for all self-healing agents"""
@@ -15,14 +39,16 @@ class BaseAgent(ABC):
                  agent_type: str = "generic",
                  config: Optional[Dict[str, Any]] = None):
         
-        self.agent_id = agent_id or f"{agent_type}_{uuid.uuid4().hex[:8]}"
+        self.agent_id = agent_id or f"{agent_type}_{os.urandom(4).hex()}"
         self.agent_type = agent_type
         self.config = config or {}
         
         self.status = "healthy"  # healthy, degraded, failed, healing
         self.error_count = 0
-        self.start_time = time.time()
-        self.last_active = time.time()
+        self.start_time = time.perf_counter()
+        # Offset turning perf_counter readings into wall-clock time for reports
+        self._wall_offset = time.time() - self.start_time
+        self._last_active = self.start_time
         
         # Performance tracking
         self.metrics = {
@@ -31,69 +57,107 @@ class BaseAgent(ABC):
             "average_response_time": 0.0,
             "total_errors": 0
         }
+        # Running mean of response times; copied into metrics by get_metrics()
+        self._avg_response_time = 0.0
         
-        # Memory for self-healing
-        self.error_history = []
-        self.healing_history = []
+        # Memory for self-healing (bounded, oldest entries drop off)
+        history_size = self.config.get("history_size", 1024)
+        self.error_history = deque(maxlen=history_size)
+        self.healing_history = deque(maxlen=history_size)
         
         print(f"🧠🧠🧠 Agent Created: {self.agent_id} ({self.agent_type})")
     
+    @property
+    def last_active(self) -> float:
+        """Wall-clock time of the last execute() call"""
+        return self._wall_offset + self._last_active
+    
     @abstractmethod
     async def process(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """Process a task - to be implemented by child classes"""
         pass
     
+    async def process_batch(self, tasks: List[Dict[str, Any]]) -> List[Any]:
+        """Process several tasks together - override to share one upstream call
+        
+        Returns one result per task; an Exception in the list fails only that task.
+        """
+        return await asyncio.gather(*(self.process(task) for task in tasks), return_exceptions=True)
+    
     async def execute(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """Execute with error handling and metrics"""
-        start_time = time.time()
-        self.last_active = time.time()
+        start_ns = time.perf_counter_ns()
+        self._last_active = start_ns / 1e9
         self.metrics["total_requests"] += 1
         
         try:
             result = await self.process(task)
-            self.metrics["successful_requests"] += 1
-            
-            # Update response time
-            response_time = time.time() - start_time
-            current_avg = self.metrics["average_response_time"]
-            total_success = self.metrics["successful_requests"]
-            self.metrics["average_response_time"] = (
-                (current_avg * (total_success - 1) + response_time) / total_success
-            )
-            
-            return {
-                "success": True,
-                "result": result,
-                "agent_id": self.agent_id,
-                "response_time": response_time,
-                "timestamp": datetime.now().isoformat()
-            }
-            
         except Exception as e:
-            self.error_count += 1
-            self.metrics["total_errors"] += 1
-            error_data = {
-                "error": str(e),
-                "task": task,
-                "timestamp": datetime.now().isoformat(),
-                "agent_status": self.status
-            }
-            self.error_history.append(error_data)
-            
-            # Auto-update status based on errors
-            if self.error_count > 10:
-                self.status = "failed"
-            elif self.error_count > 3:
-                self.status = "degraded"
-            
-            return {
-                "success": False,
-                "error": str(e),
-                "agent_id": self.agent_id,
-                "error_count": self.error_count,
-                "status": self.status,
-                "timestamp": datetime.now().isoformat()
-            }
+            return self._record_failure(task, e)
+        return self._record_success(result, time.perf_counter_ns() - start_ns)
+    
+    async def execute_batch(self, tasks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Execute tasks through process_batch, recording metrics for each task"""
+        start_ns = time.perf_counter_ns()
+        self._last_active = start_ns / 1e9
+        self.metrics["total_requests"] += len(tasks)
+        
+        try:
+            results = await self.process_batch(tasks)
+        except Exception as e:
+            return [self._record_failure(task, e) for task in tasks]
+        
+        response_time_ns = time.perf_counter_ns() - start_ns
+        return [
+            self._record_failure(task, result) if isinstance(result, Exception)
+            else self._record_success(result, response_time_ns)
+            for task, result in zip(tasks, results)
+        ]
+    
+    def _record_success(self, result: Any, response_time_ns: int) -> Dict[str, Any]:
+        """Update success metrics and build the execute() result"""
+        self.metrics["successful_requests"] += 1
+        
+        # Update response time (integer ns, converted to seconds once)
+        response_time = response_time_ns / 1e9
+        self._avg_response_time += (
+            (response_time - self._avg_response_time) / self.metrics["successful_requests"]
+        )
+        
+        return {
+            "success": True,
+            "result": result,
+            "agent_id": self.agent_id,
+            "response_time": response_time,
+            "response_time_ns": response_time_ns,
+            "timestamp": _now_ts()
+        }
+    
+    def _record_failure(self, task: Dict[str, Any], e: Exception) -> Dict[str, Any]:
+        """Update error state and build the execute() error result"""
+        self.error_count += 1
+        self.metrics["total_errors"] += 1
+        error_data = {
+            "error": str(e),
+            "task": task,
+            "timestamp": _now_ts(),
+            "agent_status": self.status
+        }
+        self.error_history.append(error_data)
+        
+        # Auto-update status based on errors (unchanged below the first threshold)
+        level = (self.error_count > _DEGRADED_AFTER) + (self.error_count > _FAILED_AFTER)
+        if level:
+            self.status = _ERROR_STATUS[level]
+        
+        return {
+            "success": False,
+            "error": str(e),
+            "agent_id": self.agent_id,
+            "error_count": self.error_count,
+            "status": self.status,
+            "timestamp": _now_ts()
+        }
     
     async def heal(self, diagnosis: Dict[str, Any] = None) -> Dict[str, Any]:
         """Self-heal the agent"""
@@ -101,7 +165,7 @@ class BaseAgent(ABC):
         
         healing_action = {
             "action": "reset",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_ts(),
             "old_error_count": self.error_count,
             "diagnosis": diagnosis or {"reason": "preventive_healing"}
         }
@@ -119,8 +183,9 @@ class BaseAgent(ABC):
         }
     
     def get_metrics(self) -> Dict[str, Any]:
-        """Get agent metrics"""
-        uptime = time.time() - self.start_time
+        """Get agent metrics (fresh each call; report loops fetch once per agent per pass)"""
+        uptime = time.perf_counter() - self.start_time
+        self.metrics["average_response_time"] = self._avg_response_time
         
         return {
             "agent_id": self.agent_id,
@@ -130,7 +195,7 @@ class BaseAgent(ABC):
             "error_count": self.error_count,
             "metrics": self.metrics,
             "last_active": datetime.fromtimestamp(self.last_active).isoformat(),
-            "needs_healing": self.error_count > 3
+            "needs_healing": self.error_count > _DEGRADED_AFTER
         }
     
     async def check_health(self) -> Dict[str, Any]:
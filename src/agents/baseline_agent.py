@@ -4,8 +4,7 @@ Baseline Agent WITHOUT Self-Healing Capability
 from typing import Dict, Any, Optional
 import asyncio
 import time
-from datetime import datetime
-import uuid
+import os
 
 class BaselineAgent:
     """Agent without self-healing capabilities - for comparison"""
@@ -14,7 +13,7 @@ class BaselineAgent:
                  agent_id: str = None,
                  agent_type: str = "baseline"):
         
-        self.agent_id = agent_id or f"baseline_{uuid.uuid4().hex[:8]}"
+        self.agent_id = agent_id or f"baseline_{os.urandom(4).hex()}"
         self.agent_type = agent_type
         
         # Basic tracking (no healing)
@@ -50,7 +49,7 @@ class BaselineAgent:
                 "result": result,
                 "agent_id": self.agent_id,
                 "response_time": time.time() - start_time,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": time.time()
             }
             
         except Exception as e:
@@ -70,7 +69,7 @@ class BaselineAgent:
                 "agent_id": self.agent_id,
                 "error_count": self.error_count,
                 "status": self.status,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": time.time()
             }
     
     def get_metrics(self) -> Dict[str, Any]:
@@ -4,7 +4,17 @@ Buggy Data Processor Agent - For Scenario C
 import asyncio
 import re
 from typing import Dict, Any
-from .base_agent import BaseAgent
+from .base_agent import BaseAgent, simulate_io
+
+# Normal-path operations; anything else gets the generic "Processed:" result
+_OPERATIONS = {
+    "reverse": lambda data: data[::-1],
+    "uppercase": str.upper,
+    "count": len
+}
+
+def _default_operation(data):
+    return f"Processed: {data}"
 
 class BuggyDataProcessor(BaseAgent):
     """Data processor with bugs that occur for specific inputs"""
@@ -21,19 +31,30 @@ class BuggyDataProcessor(BaseAgent):
             {
                 "pattern": r"special_case_\d+",
                 "description": "Causes division by zero for special_case_* inputs",
-                "fix": "Add validation check before division"
+                "fix": "Add validation check before division",
+                "error": (ZeroDivisionError, "Division by zero for input")
             },
             {
                 "pattern": r"malformed_json",
                 "description": "Causes JSON parsing error for malformed_json inputs",
-                "fix": "Add try-catch around JSON parsing"
+                "fix": "Add try-catch around JSON parsing",
+                "error": (ValueError, "JSON parsing error for")
             },
             {
                 "pattern": r"large_dataset_\d+",
                 "description": "Causes memory overflow for large_dataset_* inputs",
-                "fix": "Implement chunked processing"
+                "fix": "Implement chunked processing",
+                "error": (MemoryError, "Memory overflow processing")
             }
         ]
+        
+        # All bug patterns in one regex: each alternative is a lookahead
+        # anchored at the start, so a single match reports the first listed
+        # bug found anywhere in the input (group b<i> = known_bugs[i])
+        self._bug_regex = re.compile(
+            "|".join(f"(?=.*?(?P<b{i}>{bug['pattern']}))" for i, bug in enumerate(self.known_bugs)),
+            re.DOTALL
+        )
     
     async def process(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """Process data with simulated bugs"""
@@ -43,42 +64,19 @@ class BuggyDataProcessor(BaseAgent):
         print(f"🔧 Processing: {data[:30]}...")
         
         # Check if this input triggers known bugs
-        bug_triggered = False
-        triggered_bug = None
+        match = self._bug_regex.match(data)
         
-        for bug in self.known_bugs:
-            if re.search(bug["pattern"], data):
-                bug_triggered = True
-                triggered_bug = bug
-                break
-        
-        if bug_triggered:
+        if match:
             # Simulate the bug
-            await asyncio.sleep(0.2)
+            await simulate_io(0.2)
             
-            if "special_case_" in data:
-                # Division by zero bug
-                raise ZeroDivisionError(f"Division by zero for input: {data}")
-            elif "malformed_json" in data:
-                # JSON parsing bug
-                raise ValueError(f"JSON parsing error for: {data}")
-            elif "large_dataset_" in data:
-                # Memory error bug
-                raise MemoryError(f"Memory overflow processing: {data}")
+            error, message = self.known_bugs[int(match.lastgroup[1:])]["error"]
+            raise error(f"{message}: {data}")
         else:
             # Normal processing
-            await asyncio.sleep(0.1)
+            await simulate_io(0.1)
             
-            if operation == "reverse":
-                return {"result": data[::-1]}
-            elif operation == "uppercase":
-                return {"result": data.upper()}
-            elif operation == "count":
-                return {"result": len(data)}
-            else:
-                return {"result": f"Processed: {data}"}
-        
-        return {"result": "Should not reach here"}
+            return {"result": _OPERATIONS.get(operation, _default_operation)(data)}
     
     def add_bug_fix(self, pattern: str, fix_code: str):
         """Add a bug fix for a specific pattern"""
@@ -110,7 +108,7 @@ class BuggyDataProcessor(BaseAgent):
         print(f"📝 Fix: {fix['fix_code'][:100]}...")
         
         # Simulate applying fix
-        await asyncio.sleep(0.3)
+        await simulate_io(0.3)
         
         # Apply the fix (in real system, this would modify the code)
         fix["applied"] = True
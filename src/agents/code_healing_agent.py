@@ -6,8 +6,70 @@ import ast
 import hashlib
 import time
 import asyncio
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from .healing_agent_llm import LLMHealingAgent
+from ..utils.serialization import from_json
+
+# Known buggy inputs in one alternation; the matching group's name is the pattern label
+_INPUT_PATTERN_RE = re.compile(
+    r'(?P<special_case_number>special_case_\d+)'
+    r'|(?P<malformed_json>malformed_json)'
+    r'|(?P<large_dataset>large_dataset_\d+)'
+)
+
+# What may follow an error class in a bug pattern: nothing, or one input label
+_INPUT_LABEL_SUFFIXES = ("",) + tuple(f"_{label}" for label in _INPUT_PATTERN_RE.groupindex)
+
+# Hand-written fixes for well-known error classes, used instead of the LLM when
+# enabled and the task carries no code of its own
+_FIX_TEMPLATES = {
+    "division_by_zero": {
+        "root_cause": "Denominator can be zero for some inputs",
+        "fix_description": "Add validation check before division",
+        "corrected_code": (
+            "def process(data, divisor):\n"
+            "    # Input validation: never divide by zero\n"
+            "    if divisor == 0:\n"
+            "        return None\n"
+            "    return data / divisor\n"
+        )
+    },
+    "json_parsing": {
+        "root_cause": "Input is parsed as JSON without handling malformed documents",
+        "fix_description": "Add try-catch around JSON parsing",
+        "corrected_code": (
+            "import json\n\n"
+            "def process(data):\n"
+            "    try:\n"
+            "        return json.loads(data)\n"
+            "    except json.JSONDecodeError as e:\n"
+            "        return {\"error\": f\"Invalid JSON: {e}\"}\n"
+        )
+    },
+    "memory_overflow": {
+        "root_cause": "Whole dataset is materialized in memory at once",
+        "fix_description": "Implement chunked processing",
+        "corrected_code": (
+            "def process(data, chunk_size=1000):\n"
+            "    # Process in chunks instead of loading everything at once\n"
+            "    for start in range(0, len(data), chunk_size):\n"
+            "        yield data[start:start + chunk_size]\n"
+        )
+    }
+}
+
+# Upper bound on test_code_fix executions in flight at once
+MAX_CONCURRENT_TEST_RUNS = 32
+
+@lru_cache(maxsize=1024)
+def _is_valid_python(code: str) -> bool:
+    """Whether code parses (memoized: retries and replays re-validate the same code)"""
+    try:
+        ast.parse(code)
+        return True
+    except SyntaxError:
+        return False
 
 class CodeHealingAgent(LLMHealingAgent):
     """Healing agent that regenerates buggy code"""
@@ -61,6 +123,19 @@ class CodeHealingAgent(LLMHealingAgent):
                 "fix": self.code_fixes[bug_pattern]
             }
         
+        # Known error class and no code to fix: use its fix template instead of an LLM call
+        template = None if function_code else self._fix_template(bug_pattern)
+        if template:
+            print(f"📚 Using fix template for pattern: {bug_pattern}")
+            self._store_fix(bug_pattern, template, input_data, error_message)
+            return {
+                "success": True,
+                "action": "applied_fix_template",
+                "pattern": bug_pattern,
+                "analysis": template,
+                "message": f"Applied known fix template for bug pattern: {bug_pattern}"
+            }
+        
         # Generate new fix using LLM
         print(f"🤖 Generating new fix using {self.llm.__class__.__name__}...")
         
@@ -88,26 +163,12 @@ class CodeHealingAgent(LLMHealingAgent):
             
             # Parse response
             try:
-                import json
-                analysis = json.loads(response)
+                analysis = from_json(response)
             except:
                 analysis = {"raw_response": response}
             
-            # Store the fix
-            self.code_fixes[bug_pattern] = {
-                "analysis": analysis,
-                "pattern": bug_pattern,
-                "generated_at": self._current_timestamp(),
-                "input_example": input_data,
-                "error": error_message
-            }
-            
-            # Store bug pattern
-            self.bug_patterns[bug_pattern] = {
-                "first_seen": self._current_timestamp(),
-                "occurrences": 1,
-                "last_input": input_data
-            }
+            # Store the fix (later hits for this pattern skip the LLM)
+            self._store_fix(bug_pattern, analysis, input_data, error_message)
             
             return {
                 "success": True,
@@ -123,6 +184,31 @@ class CodeHealingAgent(LLMHealingAgent):
                 "error": f"Bug analysis failed: {str(e)}"
             }
     
+    def _fix_template(self, bug_pattern: str) -> Optional[Dict[str, Any]]:
+        """Fix template when the pattern is exactly one known error class (opt-in via config)"""
+        if not self.config.get("fix_templates", False):
+            return None
+        for error_class, template in _FIX_TEMPLATES.items():
+            if bug_pattern.startswith(error_class) and bug_pattern[len(error_class):] in _INPUT_LABEL_SUFFIXES:
+                return dict(template)
+        return None
+    
+    def _store_fix(self, bug_pattern: str, analysis: Dict[str, Any], input_data: str, error_message: str):
+        """Remember a fix and its bug pattern"""
+        self.code_fixes[bug_pattern] = {
+            "analysis": analysis,
+            "pattern": bug_pattern,
+            "generated_at": self._current_timestamp(),
+            "input_example": input_data,
+            "error": error_message
+        }
+        
+        self.bug_patterns[bug_pattern] = {
+            "first_seen": self._current_timestamp(),
+            "occurrences": 1,
+            "last_input": input_data
+        }
+    
     async def regenerate_function(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """Regenerate entire function with fixes"""
         function_name = task.get("function", "unknown_function")
@@ -168,7 +254,7 @@ class CodeHealingAgent(LLMHealingAgent):
                 }
             
             # Store regenerated function
-            code_hash = hashlib.md5(new_code.encode()).hexdigest()[:8]
+            code_hash = hashlib.blake2b(new_code.encode(), digest_size=4).hexdigest()
             self.regenerated_functions[function_name] = {
                 "new_code": new_code,
                 "original_code": original_code,
@@ -200,28 +286,21 @@ class CodeHealingAgent(LLMHealingAgent):
         
         print(f"🧪 Testing code fix with {len(test_inputs)} test cases")
         
-        results = []
+        # Test inputs are independent, so run them concurrently (bounded)
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_TEST_RUNS)
         
-        for test_input in test_inputs:
-            try:
-                # Test original code (should fail for buggy inputs)
-                original_result = await self._execute_code_safely(original_code, test_input)
-                
-                # Test fixed code
-                fixed_result = await self._execute_code_safely(fixed_code, test_input)
-                
-                results.append({
-                    "input": test_input,
-                    "original_success": original_result["success"],
-                    "fixed_success": fixed_result["success"],
-                    "improvement": fixed_result["success"] and not original_result["success"]
-                })
-                
-            except Exception as e:
-                results.append({
-                    "input": test_input,
-                    "error": str(e)
-                })
+        async def bounded(test_input):
+            async with semaphore:
+                return await self._run_one(original_code, fixed_code, test_input)
+        
+        outcomes = await asyncio.gather(
+            *(bounded(test_input) for test_input in test_inputs),
+            return_exceptions=True
+        )
+        results = [
+            {"input": test_input, "error": str(outcome)} if isinstance(outcome, Exception) else outcome
+            for test_input, outcome in zip(test_inputs, outcomes)
+        ]
         
         improvements = sum(1 for r in results if r.get("improvement", False))
         
@@ -233,37 +312,47 @@ class CodeHealingAgent(LLMHealingAgent):
             "improvement_rate": improvements / len(test_inputs) if test_inputs else 0
         }
     
+    async def _run_one(self, original_code: str, fixed_code: str, test_input: str) -> Dict[str, Any]:
+        """Run one test input through the original and fixed code"""
+        # Original code (should fail for buggy inputs) and fixed code
+        original_result, fixed_result = await asyncio.gather(
+            self._execute_code_safely(original_code, test_input),
+            self._execute_code_safely(fixed_code, test_input)
+        )
+        
+        return {
+            "input": test_input,
+            "original_success": original_result["success"],
+            "fixed_success": fixed_result["success"],
+            "improvement": fixed_result["success"] and not original_result["success"]
+        }
+    
     def _extract_bug_pattern(self, error_message: str, input_data: str) -> str:
         """Extract pattern from bug"""
         # Simple pattern extraction
         patterns = []
         
-        if "division" in error_message.lower() and "zero" in error_message.lower():
+        error_lower = error_message.lower()
+        
+        if "division" in error_lower and "zero" in error_lower:
             patterns.append("division_by_zero")
         
-        if "json" in error_message.lower():
+        if "json" in error_lower:
             patterns.append("json_parsing")
         
-        if "memory" in error_message.lower():
+        if "memory" in error_lower:
             patterns.append("memory_overflow")
         
         # Extract input pattern
-        if re.search(r'special_case_\d+', input_data):
-            patterns.append("special_case_number")
-        elif re.search(r'malformed_json', input_data):
-            patterns.append("malformed_json")
-        elif re.search(r'large_dataset_\d+', input_data):
-            patterns.append("large_dataset")
+        match = _INPUT_PATTERN_RE.search(input_data)
+        if match:
+            patterns.append(match.lastgroup)
         
         return "_".join(patterns) if patterns else "unknown_bug"
     
     async def _validate_python_code(self, code: str) -> bool:
         """Validate Python code syntax"""
-        try:
-            ast.parse(code)
-            return True
-        except SyntaxError:
-            return False
+        return _is_valid_python(code)
     
     async def _execute_code_safely(self, code: str, input_data: str) -> Dict[str, Any]:
         """Execute code safely in a restricted environment"""
@@ -1,10 +1,10 @@
 
 from typing import Dict, Any, Optional, List
 import asyncio
-import json
-from datetime import datetime
-from .base_agent import BaseAgent
+from ..utils.serialization import to_json, from_json
+from .base_agent import BaseAgent, next_operation_id
 from ..api.qwen_client import QwenClient
+from ..utils.config import get_settings
 import time
 
 class HealingAgent(BaseAgent):
@@ -12,12 +12,13 @@ class HealingAgent(BaseAgent):
     
     def __init__(self,
                  agent_id: str = "master_healer",
-                 config: Optional[Dict[str, Any]] = None):
+                 config: Optional[Dict[str, Any]] = None,
+                 qwen: Optional[QwenClient] = None):
         
         super().__init__(agent_id, "healer", config)
         
-        # Initialize Qwen AI
-        self.qwen = QwenClient()
+        # Initialize Qwen AI (or share the caller's client and its connections)
+        self.qwen = qwen or QwenClient()
         
         # Healing expertise database
         self.expertise = {
@@ -75,13 +76,13 @@ class HealingAgent(BaseAgent):
         
         # Record the operation
         operation = {
-            "operation_id": f"heal_{int(time.time())}",
+            "operation_id": next_operation_id("heal"),
             "target_agent": target_agent,
             "issue": issue_description,
             "diagnosis": diagnosis,
             "healing_plan": healing_plan,
             "result": healing_result,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": time.time(),
             "healer_id": self.agent_id
         }
         
@@ -104,7 +105,7 @@ class HealingAgent(BaseAgent):
         Issue Description: {issue}
         
         Agent Metrics:
-        {json.dumps(metrics, indent=2)}
+        {to_json(metrics)}
         
         Analyze and provide:
         1. Root cause analysis
@@ -124,7 +125,7 @@ class HealingAgent(BaseAgent):
             
             # Parse the response
             try:
-                diagnosis = json.loads(response)
+                diagnosis = from_json(response)
             except:
                 diagnosis = {"ai_analysis": response, "parsed": False}
             
@@ -151,7 +152,7 @@ class HealingAgent(BaseAgent):
         For Agent: {target_agent}
         
         Diagnosis:
-        {json.dumps(diagnosis, indent=2)}
+        {to_json(diagnosis)}
         
         Create a detailed healing plan with:
         1. Step-by-step procedure
@@ -173,7 +174,7 @@ class HealingAgent(BaseAgent):
             return {
                 "plan": response,
                 "generated_by": "qwen_ai",
-                "generated_at": datetime.now().isoformat()
+                "generated_at": time.time()
             }
             
         except Exception as e:
@@ -215,10 +216,10 @@ class HealingAgent(BaseAgent):
         SYSTEM-WIDE DIAGNOSIS
         
         System Metrics:
-        {json.dumps(system_metrics, indent=2)}
+        {to_json(system_metrics)}
         
         Agents Status:
-        {json.dumps(agents_status, indent=2)}
+        {to_json(agents_status)}
         
         Analyze overall system health and identify:
         1. Critical issues
@@ -238,7 +239,7 @@ class HealingAgent(BaseAgent):
             
             return {
                 "system_analysis": analysis,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": time.time(),
                 "analyzed_agents": len(agents_status)
             }
             
@@ -250,18 +251,22 @@ class HealingAgent(BaseAgent):
         
         agents = task.get("agents", [])
         
-        recommendations = []
+        # One independent LLM call per at-risk agent: fan them out, at most
+        # max_agent_concurrency (>= 1) in flight to stay within provider rate limits
+        candidates = [agent for agent in agents if agent.get("error_count", 0) > 2]
+        semaphore = asyncio.Semaphore(max(1, get_settings().max_agent_concurrency))
         
-        for agent in agents:
-            if agent.get("error_count", 0) > 2:
-                rec = await self._generate_preventive_recommendation(agent)
-                recommendations.append(rec)
+        async def bounded(agent):
+            async with semaphore:
+                return await self._generate_preventive_recommendation(agent)
+        
+        recommendations = list(await asyncio.gather(*(bounded(agent) for agent in candidates)))
         
         return {
             "preventive_check": True,
             "agents_checked": len(agents),
             "recommendations": recommendations,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": time.time()
         }
     
     async def _generate_preventive_recommendation(self,
@@ -3,10 +3,9 @@ Healing Agent with LLM-Agnostic Architecture
 """
 from typing import Dict, Any, Optional
 import asyncio
-import json
-from datetime import datetime
+from ..utils.serialization import to_json, from_json
 import time
-from .base_agent import BaseAgent
+from .base_agent import BaseAgent, next_operation_id
 from ..api.llm_provider import LLMFactory, LLMConfig
 
 class LLMHealingAgent(BaseAgent):
@@ -73,14 +72,14 @@ class LLMHealingAgent(BaseAgent):
         
         # Record operation
         operation = {
-            "operation_id": f"heal_{int(time.time())}",
+            "operation_id": next_operation_id("heal"),
             "target_agent": target_agent,
             "issue": issue_description,
             "diagnosis": diagnosis,
             "healing_plan": healing_plan,
             "result": healing_result,
             "llm_used": self.llm.__class__.__name__,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": time.time()
         }
         
         self.healing_operations.append(operation)
@@ -100,7 +99,7 @@ class LLMHealingAgent(BaseAgent):
         DIAGNOSE SYSTEM ISSUE
         
         Issue: {issue}
-        Metrics: {json.dumps(metrics, indent=2)}
+        Metrics: {to_json(metrics)}
         
         Provide:
         1. Root cause analysis
@@ -118,7 +117,7 @@ class LLMHealingAgent(BaseAgent):
             )
             
             try:
-                return json.loads(response)
+                return from_json(response)
             except:
                 return {"analysis": response, "parsed": False}
                 
@@ -140,7 +139,7 @@ class LLMHealingAgent(BaseAgent):
         CREATE HEALING PLAN
         
         For Agent: {target_agent}
-        Diagnosis: {json.dumps(diagnosis, indent=2)}
+        Diagnosis: {to_json(diagnosis)}
         
         Create a step-by-step healing plan.
         """
@@ -155,7 +154,7 @@ class LLMHealingAgent(BaseAgent):
             return {
                 "plan": response,
                 "generated_by": self.llm.__class__.__name__,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": time.time()
             }
             
         except Exception as e:
@@ -41,6 +41,16 @@ class VulnerableAgent(BaseAgent):
                 r".*(password|123456|qwerty).*"
             ]
         }
+        
+        # One precompiled regex per attack type; the ".*" wrappers are
+        # redundant under re.search and only add backtracking
+        self._attack_regexes = {
+            attack_type: re.compile(
+                "|".join(f"(?:{p.removeprefix('.*').removesuffix('.*')})" for p in patterns),
+                re.IGNORECASE
+            )
+            for attack_type, patterns in self.attack_patterns.items()
+        }
     
     async def process(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """Process request with security vulnerabilities"""
@@ -91,16 +101,10 @@ class VulnerableAgent(BaseAgent):
     
     def _detect_attacks(self, input_str: str) -> list:
         """Detect security attacks in input"""
-        detected = []
-        
-        for attack_type, patterns in self.attack_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, input_str, re.IGNORECASE):
-                    if attack_type not in detected:
-                        detected.append(attack_type)
-                    break
-        
-        return detected
+        return [
+            attack_type for attack_type, regex in self._attack_regexes.items()
+            if regex.search(input_str)
+        ]
     
     def add_security_measure(self, attack_type: str, measure_code: str):
         """Add security measure for specific attack type"""
@@ -2,8 +2,12 @@
 LLM Provider Abstraction Layer - FIXED VERSION
 """
 import os
+import time
 import asyncio
+import functools
+import textwrap
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from typing import Dict, Any, Optional
 from enum import Enum
 from dataclasses import dataclass
@@ -15,6 +19,7 @@ class LLMProvider(Enum):
     ANTHROPIC = "anthropic"
     OLLAMA = "ollama"
     LOCAL = "local"
+    MOCK = "mock"
 
 @dataclass
 class LLMConfig:
@@ -26,6 +31,57 @@ class LLMConfig:
     temperature: float = 0.7
     max_tokens: int = 500
 
+RESPONSE_CACHE_SIZE = 512
+# Seconds a cached response stays valid; diagnoses go stale as the system changes
+RESPONSE_CACHE_TTL = 300.0
+
+def cached_generate(generate):
+    """Memoize a client's generate() with a per-instance exact-match LRU cache (with TTL)
+    
+    Pass use_cache=False to always call the provider (e.g. health probes).
+    """
+    
+    @functools.wraps(generate)
+    async def wrapper(self, prompt, system_prompt=None, use_cache=True, **kwargs):
+        if not use_cache:
+            return await generate(self, prompt, system_prompt, **kwargs)
+        
+        cache = self.__dict__.get("_response_cache")
+        if cache is None:
+            cache = self._response_cache = OrderedDict()
+            self.cache_stats = {"hits": 0, "misses": 0}
+        
+        try:
+            # Dedented and stripped, so re-indented prompt templates share entries;
+            # interior whitespace is kept (prompts embed indentation-sensitive code)
+            key = (
+                textwrap.dedent(system_prompt or "").strip(),
+                textwrap.dedent(prompt).strip(),
+                tuple(sorted(kwargs.items()))
+            )
+            hash(key)
+        except TypeError:
+            # Unhashable kwargs (e.g. lists): skip the cache
+            return await generate(self, prompt, system_prompt, **kwargs)
+        
+        now = time.monotonic()
+        entry = cache.get(key)
+        if entry is not None:
+            if entry[0] > now:
+                cache.move_to_end(key)
+                self.cache_stats["hits"] += 1
+                return entry[1]
+            del cache[key]
+        
+        self.cache_stats["misses"] += 1
+        response = await generate(self, prompt, system_prompt, **kwargs)
+        cache[key] = (now + RESPONSE_CACHE_TTL, response)
+        if len(cache) > RESPONSE_CACHE_SIZE:
+            cache.popitem(last=False)
+        return response
+    
+    return wrapper
+
 class BaseLLMClient(ABC):
     """Abstract base class for LLM clients"""
     
@@ -59,6 +115,7 @@ class QwenClient(BaseLLMClient):
         )
         print(f"🤖 Qwen Client initialized with model: {config.model}")
     
+    @cached_generate
     async def generate(self, 
                       prompt: str,
                       system_prompt: Optional[str] = None,
@@ -69,8 +126,9 @@ class QwenClient(BaseLLMClient):
         messages.append({"role": "user", "content": prompt})
         
         try:
-            # Try chat completion first
-            response = self.client.chat.completions.create(
+            # Try chat completion first (the HF client is blocking, so run it off the event loop)
+            response = await asyncio.to_thread(
+                self.client.chat.completions.create,
                 model=self.config.model,
                 messages=messages,
                 max_tokens=self.config.max_tokens,
@@ -89,7 +147,8 @@ class QwenClient(BaseLLMClient):
             print(f"Chat completion failed, trying text generation: {e}")
             try:
                 full_prompt = f"System: {system_prompt}\n\nUser: {prompt}\n\nAssistant:" if system_prompt else prompt
-                response = self.client.text_generation(
+                response = await asyncio.to_thread(
+                    self.client.text_generation,
                     prompt=full_prompt,
                     max_new_tokens=self.config.max_tokens,
                     temperature=self.config.temperature,
@@ -101,7 +160,7 @@ class QwenClient(BaseLLMClient):
     
     async def check_health(self) -> bool:
         try:
-            test = await self.generate("Say OK", max_tokens=5)
+            test = await self.generate("Say OK", use_cache=False, max_tokens=5)
             return "OK" in test.upper()
         except:
             return False
@@ -118,6 +177,7 @@ class OpenAIClient(BaseLLMClient):
         
         self.client = AsyncOpenAI(api_key=config.api_key)
     
+    @cached_generate
     async def generate(self,
                       prompt: str,
                       system_prompt: Optional[str] = None,
@@ -139,11 +199,30 @@ class OpenAIClient(BaseLLMClient):
     
     async def check_health(self) -> bool:
         try:
-            await self.generate("Say OK", max_tokens=5)
+            await self.generate("Say OK", use_cache=False, max_tokens=5)
             return True
         except:
             return False
 
+class MockClient(BaseLLMClient):
+    """Mock client for running without API calls"""
+    
+    def __init__(self, config: LLMConfig):
+        from .mock_llm import MockLLM
+        
+        self.config = config
+        self.mock = MockLLM()
+    
+    @cached_generate
+    async def generate(self,
+                      prompt: str,
+                      system_prompt: Optional[str] = None,
+                      **kwargs) -> str:
+        return await self.mock.generate(prompt, system_prompt, **kwargs)
+    
+    async def check_health(self) -> bool:
+        return await self.mock.check_health()
+
 class LLMFactory:
     """Factory for creating LLM clients"""
     
@@ -154,6 +233,8 @@ class LLMFactory:
             return QwenClient(config)
         elif config.provider == LLMProvider.OPENAI:
             return OpenAIClient(config)
+        elif config.provider == LLMProvider.MOCK:
+            return MockClient(config)
         else:
             raise ValueError(f"Unsupported provider: {config.provider}")
     
@@ -175,6 +256,8 @@ class LLMFactory:
                 model=model,
                 api_key=os.getenv("OPENAI_API_KEY")
             )
+        elif provider == "mock":
+            config = LLMConfig(provider=LLMProvider.MOCK, model="mock")
         else:
             raise ValueError(f"Unsupported provider: {provider}")
         
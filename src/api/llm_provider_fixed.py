@@ -83,8 +83,9 @@ class SimpleQwenClient(BaseLLMClient):
         }
         
         try:
-            # Make the request
-            response = requests.post(
+            # Make the request (requests is blocking, so run it off the event loop)
+            response = await asyncio.to_thread(
+                requests.post,
                 self.api_url,
                 headers=self.headers,
                 json=payload,
@@ -9,7 +9,10 @@ from typing import Optional, Dict, Any, List
 class MockLLM:
     """Mock LLM that returns realistic responses for testing"""
     
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
+        # Instance-local RNG so a seed makes runs reproducible without
+        # touching the global random state
+        self._rng = random.Random(seed)
         self.responses = {
             "diagnosis": {
                 "root_cause": "API connection timeout due to network latency",
@@ -122,7 +125,7 @@ def sanitize_input(input_str: str) -> str:
                       max_tokens: int = 500,
                       **kwargs) -> str:
         """Return mock responses based on prompt content"""
-        await asyncio.sleep(random.uniform(0.1, 0.5))  # Simulate API delay
+        await asyncio.sleep(self._rng.uniform(0.1, 0.5))  # Simulate API delay
         
         prompt_lower = prompt.lower()
         
@@ -151,7 +154,7 @@ def sanitize_input(input_str: str) -> str:
         
         # Generic response
         else:
-            response = random.choice(self.generic_responses)
+            response = self._rng.choice(self.generic_responses)
             if len(prompt) > 20:
                 response += f"\n\nSpecifically regarding '{prompt[:50]}...', I suggest implementing automated monitoring and retry logic."
             return response
@@ -175,7 +178,7 @@ def sanitize_input(input_str: str) -> str:
             # Return in requested format
             return {
                 "analysis": response,
-                "confidence": random.uniform(0.7, 0.95),
+                "confidence": self._rng.uniform(0.7, 0.95),
                 "recommendations": ["Implement fix", "Monitor results", "Test thoroughly"],
                 "timestamp": "2024-01-01T00:00:00Z"
             }
\ No newline at end of file
@@ -1,28 +1,28 @@
 """
 Main Qwen Client for Self-Healing Agents Project - FIXED VERSION
 """
-import os
 import asyncio
 import json
 from typing import Optional, Dict, Any, List
 from huggingface_hub import InferenceClient
-from dotenv import load_dotenv
-
-load_dotenv()
+from .llm_provider import cached_generate
+from ..utils.config import get_settings
 
 class QwenClient:
     """Main Qwen client for the self-healing agents project - FIXED"""
     
     def __init__(self, model: str = None):
-        self.hf_token = os.getenv("HF_TOKEN")
+        settings = get_settings()
+        self.hf_token = settings.hf_token
         if not self.hf_token:
             raise ValueError("HF_TOKEN not found in .env file")
             
-        self.model = model or os.getenv("QWEN_MODEL", "Qwen/Qwen2.5-7B-Instruct")
+        self.model = model or settings.qwen_model
         self.client = InferenceClient(model=self.model, token=self.hf_token)
         
         print(f"🤖 Qwen AI Activated: {self.model}")
     
+    @cached_generate
     async def generate(self,
                       prompt: str,
                       system_prompt: Optional[str] = None,
@@ -38,7 +38,9 @@ class QwenClient:
         
         try:
             # FIX: Use correct parameter names for newer HuggingFace API
-            response = self.client.chat.completions.create(
+            # (the HF client is blocking, so run it off the event loop)
+            response = await asyncio.to_thread(
+                self.client.chat.completions.create,
                 model=self.model,
                 messages=messages,
                 max_tokens=max_tokens,
@@ -62,7 +64,8 @@ class QwenClient:
             # Try alternative API format if the above fails
             try:
                 # Fallback to text generation API
-                response = self.client.text_generation(
+                response = await asyncio.to_thread(
+                    self.client.text_generation,
                     prompt=f"System: {system_prompt}\n\nUser: {prompt}\n\nAssistant:",
                     max_new_tokens=max_tokens,
                     temperature=temperature,
@@ -98,7 +101,7 @@ class QwenClient:
     async def check_health(self) -> bool:
         """Check if Qwen API is accessible"""
         try:
-            test = await self.generate("Say OK", max_tokens=5)
+            test = await self.generate("Say OK", use_cache=False, max_tokens=5)
             return "OK" in test.upper()
         except:
             return False
@@ -1,28 +1,33 @@
 
 import os
+from functools import lru_cache
 from typing import Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from dotenv import load_dotenv
 
-load_dotenv()
+def _env(name: str, default: str):
+    """Field factory reading an environment variable when the config is created"""
+    return field(default_factory=lambda: os.getenv(name, default))
 
-@dataclass
+@dataclass(frozen=True)
 class SystemConfig:
     """System configuration"""
     
     # Qwen AI Configuration
-    hf_token: str = os.getenv("HF_TOKEN", "")
-    qwen_model: str = os.getenv("QWEN_MODEL", "Qwen/Qwen2.5-7B-Instruct")
+    hf_token: str = _env("HF_TOKEN", "")
+    qwen_model: str = _env("QWEN_MODEL", "Qwen/Qwen2.5-7B-Instruct")
     
     # Agent Configuration
-    max_retries: int = int(os.getenv("MAX_RETRIES", "3"))
-    healing_threshold: float = float(os.getenv("HEALING_THRESHOLD", "0.7"))
-    log_level: str = os.getenv("LOG_LEVEL", "INFO")
+    max_retries: int = field(default_factory=lambda: int(os.getenv("MAX_RETRIES", "3")))
+    healing_threshold: float = field(default_factory=lambda: float(os.getenv("HEALING_THRESHOLD", "0.7")))
+    log_level: str = _env("LOG_LEVEL", "INFO")
     
     # System Configuration
-    enable_monitoring: bool = os.getenv("ENABLE_MONITORING", "true").lower() == "true"
-    enable_healing: bool = os.getenv("ENABLE_HEALING", "true").lower() == "true"
-    max_agents: int = int(os.getenv("MAX_AGENTS", "10"))
+    enable_monitoring: bool = field(default_factory=lambda: os.getenv("ENABLE_MONITORING", "true").lower() == "true")
+    enable_healing: bool = field(default_factory=lambda: os.getenv("ENABLE_HEALING", "true").lower() == "true")
+    max_agents: int = field(default_factory=lambda: int(os.getenv("MAX_AGENTS", "10")))
+    max_agent_concurrency: int = field(default_factory=lambda: int(os.getenv("MAX_AGENT_CONCURRENCY", "4")))
+    simulate_io: bool = field(default_factory=lambda: os.getenv("SIMULATE_IO", "true").lower() == "true")
     
     def validate(self):
         """Validate configuration"""
@@ -31,6 +36,9 @@ class SystemConfig:
         
         if not self.hf_token.startswith("hf_"):
             print("⚠️  Warning: HF_TOKEN doesn't start with 'hf_' - may be invalid")
+        
+        if self.max_agent_concurrency < 1:
+            raise ValueError("MAX_AGENT_CONCURRENCY must be at least 1")
     
     @classmethod
     def load(cls):
@@ -48,5 +56,13 @@ class SystemConfig:
             "log_level": self.log_level,
             "enable_monitoring": self.enable_monitoring,
             "enable_healing": self.enable_healing,
-            "max_agents": self.max_agents
-        }
\ No newline at end of file
+            "max_agents": self.max_agents,
+            "max_agent_concurrency": self.max_agent_concurrency,
+            "simulate_io": self.simulate_io
+        }
+
+@lru_cache(maxsize=1)
+def get_settings() -> SystemConfig:
+    """Load .env into the environment once and return the shared settings"""
+    load_dotenv()
+    return SystemConfig()
@@ -0,0 +1,22 @@
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional: faster prompt/response JSON when installed
+    orjson = None
+
+def to_json(obj: Any) -> str:
+    """Indented JSON for LLM prompts (orjson when available)"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass  # types orjson rejects: let the stdlib serialize (or raise) as before
+    return json.dumps(obj, indent=2)
+
+def from_json(text: str) -> Any:
+    """Parse an LLM response as JSON (raises ValueError when it is not JSON)"""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
@@ -23,4 +23,210 @@ async def test_agent_creation():
     
     agent = TestAgent("test_agent")
     assert agent.agent_id == "test_agent"
-    assert agent.agent_type == "generic"
\ No newline at end of file
+    assert agent.agent_type == "generic"
+
+@pytest.mark.asyncio
+async def test_execute_batch_records_each_task():
+    """execute_batch returns one result per task and fails only the tasks that raised"""
+    from src.agents.base_agent import BaseAgent
+    
+    class TestAgent(BaseAgent):
+        async def process(self, task):
+            if task.get("fail"):
+                raise ValueError("boom")
+            return {"value": task["value"]}
+    
+    agent = TestAgent("batch_agent")
+    results = await agent.execute_batch([{"value": 1}, {"fail": True}, {"value": 3}])
+    
+    assert [r["success"] for r in results] == [True, False, True]
+    assert results[2]["result"] == {"value": 3}
+    assert results[1]["error"] == "boom"
+    assert agent.metrics["total_requests"] == 3
+    assert agent.metrics["successful_requests"] == 2
+    assert agent.error_count == 1
+
+@pytest.mark.asyncio
+async def test_get_metrics_reflects_latest_state():
+    """get_metrics reports errors and status changes made since the previous call"""
+    from src.agents.base_agent import BaseAgent
+    
+    class FailingAgent(BaseAgent):
+        async def process(self, task):
+            raise ValueError("boom")
+    
+    agent = FailingAgent("failing_agent")
+    for _ in range(3):
+        await agent.execute({})
+    first = agent.get_metrics()
+    
+    await agent.execute({})
+    second = agent.get_metrics()
+    agent.status = "failed"
+    
+    assert (first["error_count"], first["status"]) == (3, "healthy")
+    assert (second["error_count"], second["status"]) == (4, "degraded")
+    assert agent.get_metrics()["status"] == "failed"
+    assert second is not first
+
+@pytest.mark.asyncio
+async def test_simulate_io_off_skips_sleeps(monkeypatch):
+    """SIMULATE_IO=false drops the simulated latency from agent processing"""
+    import time
+    from src.agents import base_agent
+    from src.agents.buggy_processor import BuggyDataProcessor
+    from src.utils.config import SystemConfig
+    
+    monkeypatch.setenv("SIMULATE_IO", "false")
+    monkeypatch.setattr(base_agent, "get_settings", SystemConfig)
+    agent = BuggyDataProcessor()
+    
+    start = time.perf_counter()
+    result = await agent.process({"data": "abc", "operation": "reverse"})
+    
+    assert result == {"result": "cba"}
+    assert time.perf_counter() - start < 0.05  # simulated I/O sleeps 0.1s
+
+@pytest.mark.asyncio
+async def test_qwen_generate_does_not_block_event_loop(monkeypatch):
+    """Concurrent generate calls overlap instead of serializing on the blocking HF client"""
+    import time
+    from types import SimpleNamespace
+    from src.api import qwen_client
+    from src.utils.config import SystemConfig
+    
+    def slow_create(**kwargs):
+        time.sleep(0.1)
+        message = SimpleNamespace(content="OK")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+    
+    class FakeInferenceClient:
+        def __init__(self, **kwargs):
+            self.chat = SimpleNamespace(completions=SimpleNamespace(create=slow_create))
+    
+    monkeypatch.setattr(qwen_client, "get_settings", lambda: SystemConfig(hf_token="hf_test"))
+    monkeypatch.setattr(qwen_client, "InferenceClient", FakeInferenceClient)
+    client = qwen_client.QwenClient()
+    
+    start = time.perf_counter()
+    responses = await asyncio.gather(*(client.generate("ping") for _ in range(10)))
+    elapsed = time.perf_counter() - start
+    
+    assert responses == ["OK"] * 10
+    assert elapsed < 0.5  # serial execution would take ~1s
+
+@pytest.mark.asyncio
+async def test_cached_generate_reuses_identical_prompts():
+    """Identical prompts are answered from the client's response cache"""
+    from src.api.llm_provider import cached_generate
+    
+    class CountingClient:
+        calls = 0
+        
+        @cached_generate
+        async def generate(self, prompt, system_prompt=None, **kwargs):
+            CountingClient.calls += 1
+            return f"{prompt}:{CountingClient.calls}"
+    
+    client = CountingClient()
+    first = await client.generate("diagnose", system_prompt="sys", max_tokens=10)
+    second = await client.generate("diagnose", system_prompt="sys", max_tokens=10)
+    other = await client.generate("diagnose", system_prompt="sys", max_tokens=20)
+    
+    probe = await client.generate("diagnose", system_prompt="sys", use_cache=False, max_tokens=10)
+    
+    assert first == second == "diagnose:1"
+    assert other == "diagnose:2"
+    assert probe == "diagnose:3"  # use_cache=False always reaches the provider
+    assert CountingClient.calls == 3
+    assert client.cache_stats == {"hits": 1, "misses": 2}
+
+@pytest.mark.asyncio
+async def test_cached_generate_expires_after_ttl(monkeypatch):
+    """Cached responses are regenerated once RESPONSE_CACHE_TTL has passed"""
+    from src.api import llm_provider
+    
+    class CountingClient:
+        calls = 0
+        
+        @llm_provider.cached_generate
+        async def generate(self, prompt, system_prompt=None, **kwargs):
+            CountingClient.calls += 1
+            return f"{prompt}:{CountingClient.calls}"
+    
+    client = CountingClient()
+    first = await client.generate("diagnose")
+    reindented = await client.generate("\n        diagnose\n        ")
+    
+    nested = await client.generate("if x:\n    a()\n    b()")
+    dedented = await client.generate("if x:\n    a()\nb()")
+    
+    monkeypatch.setattr(llm_provider, "RESPONSE_CACHE_TTL", -1.0)
+    await client.generate("other")
+    expired_first = await client.generate("other")
+    
+    assert first == reindented == "diagnose:1"
+    assert nested != dedented  # indentation inside the prompt is significant
+    assert expired_first == "other:5"
+    assert CountingClient.calls == 5
+
+def test_llm_provider_mock_env(monkeypatch):
+    """LLM_PROVIDER=mock makes the factory hand out the mock client"""
+    from src.api.llm_provider import LLMFactory, MockClient
+    
+    monkeypatch.setenv("LLM_PROVIDER", "mock")
+    
+    assert isinstance(LLMFactory.from_env(), MockClient)
+
+@pytest.mark.asyncio
+async def test_known_error_class_uses_fix_template(monkeypatch):
+    """With fix_templates on, a single known error class without code gets a template fix"""
+    from src.agents.code_healing_agent import CodeHealingAgent
+    
+    monkeypatch.setenv("LLM_PROVIDER", "mock")
+    healer = CodeHealingAgent("code_doctor", config={"fix_templates": True})
+    
+    calls = []
+    async def generate(prompt, system_prompt=None, **kwargs):
+        calls.append(prompt)
+        return '{"corrected_code": "pass"}'
+    monkeypatch.setattr(healer.llm, "generate", generate)
+    
+    known = await healer.analyze_and_fix_bug({
+        "error": "Division by zero for input: special_case_7",
+        "input": "special_case_7"
+    })
+    combined = await healer.analyze_and_fix_bug({"error": "JSON memory error", "input": "x"})
+    unknown = await healer.analyze_and_fix_bug({"error": "KeyError: 'id'", "input": "record_1"})
+    
+    assert known["action"] == "applied_fix_template"
+    assert "division_by_zero_special_case_number" in healer.code_fixes
+    assert combined["pattern"] == "json_parsing_memory_overflow"
+    assert combined["action"] == "generated_new_fix"
+    assert unknown["action"] == "generated_new_fix"
+    assert len(calls) == 2
+
+@pytest.mark.asyncio
+async def test_bug_with_code_gets_fix_for_that_code(monkeypatch):
+    """A task carrying code is fixed by the LLM, never answered with a canned template"""
+    from src.agents.code_healing_agent import CodeHealingAgent
+    
+    monkeypatch.setenv("LLM_PROVIDER", "mock")
+    healer = CodeHealingAgent("code_doctor", config={"fix_templates": True})
+    
+    calls = []
+    async def generate(prompt, system_prompt=None, **kwargs):
+        calls.append(prompt)
+        return '{"corrected_code": "def calculate_average(numbers):\\n    return sum(numbers) / len(numbers) if numbers else 0"}'
+    monkeypatch.setattr(healer.llm, "generate", generate)
+    
+    code = "def calculate_average(numbers):\n    return sum(numbers) / len(numbers)"
+    result = await healer.analyze_and_fix_bug({
+        "error": "ZeroDivisionError: division by zero",
+        "input": "[]",
+        "code": code
+    })
+    
+    assert result["action"] == "generated_new_fix"
+    assert result["analysis"]["corrected_code"].startswith("def calculate_average")
+    assert len(calls) == 1 and code in calls[0]